@@ -1,14 +1,41 @@
 """Configuration data for Kenya Digital Farm Twin."""
 
-from config.crops import CROP_OPTIONS
-from config.locations import LOCATION_OPTIONS
-from config.soils import SOIL_TYPES, SOIL_PARAM_INFO
-from config.fertilizers import DEFAULT_FERT_SCENARIOS
+from config.crops import CROP_OPTIONS, PHENOPHASES, PHENOPHASES_NP
+from config.locations import LOC_INDEX, LOC_KEYS, LOC_LAT, LOC_LON, LOCATION_OPTIONS
+from config.soils import (
+    SOIL_INDEX,
+    SOIL_KEYS,
+    SOIL_PARAM_INFO,
+    SOIL_PARAMS,
+    SOIL_TABLE,
+    SOIL_TYPES,
+)
+from config.fertilizers import (
+    DEFAULT_FERT_SCENARIOS,
+    Application,
+    applications_soa,
+    copy_scenarios,
+    fresh_defaults,
+)
 
 __all__ = [
     "CROP_OPTIONS",
+    "PHENOPHASES",
+    "PHENOPHASES_NP",
     "LOCATION_OPTIONS",
+    "LOC_INDEX",
+    "LOC_KEYS",
+    "LOC_LAT",
+    "LOC_LON",
     "SOIL_TYPES",
     "SOIL_PARAM_INFO",
+    "SOIL_PARAMS",
+    "SOIL_KEYS",
+    "SOIL_INDEX",
+    "SOIL_TABLE",
     "DEFAULT_FERT_SCENARIOS",
+    "fresh_defaults",
+    "copy_scenarios",
+    "Application",
+    "applications_soa",
 ]
@@ -1,39 +1,88 @@
 """Fertilizer scenario configuration data."""
 
-DEFAULT_FERT_SCENARIOS = {
+import pickle
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Dict, Iterable
+
+import numpy as np
+
+# One N application: days after planting, kg N/ha, recovery fraction
+Application = namedtuple("Application", "day amount recovery")
+
+_DEFAULT_FERT_SCENARIOS = {
     "none": {
         "name": "No Fertilizer",
         "total_n": 0,
-        "applications": [],
+        "applications": (),
         "description": "Baseline - soil N only",
         "enabled": True,
     },
     "low": {
         "name": "Low (25 kg N/ha)",
         "total_n": 25,
-        "applications": [(0, 15, 0.7), (30, 10, 0.6)],
+        "applications": (Application(0, 15, 0.7), Application(30, 10, 0.6)),
         "description": "Typical smallholder",
         "enabled": True,
     },
     "medium": {
         "name": "Medium (50 kg N/ha)",
         "total_n": 50,
-        "applications": [(0, 20, 0.7), (30, 15, 0.65), (50, 15, 0.6)],
+        "applications": (
+            Application(0, 20, 0.7),
+            Application(30, 15, 0.65),
+            Application(50, 15, 0.6),
+        ),
         "description": "Improved smallholder",
         "enabled": True,
     },
     "recommended": {
         "name": "Recommended (75 kg N/ha)",
         "total_n": 75,
-        "applications": [(0, 25, 0.7), (30, 25, 0.65), (50, 25, 0.6)],
+        "applications": (
+            Application(0, 25, 0.7),
+            Application(30, 25, 0.65),
+            Application(50, 25, 0.6),
+        ),
         "description": "Extension recommendation",
         "enabled": True,
     },
     "high": {
         "name": "High (100 kg N/ha)",
         "total_n": 100,
-        "applications": [(0, 30, 0.7), (25, 35, 0.65), (50, 35, 0.6)],
+        "applications": (
+            Application(0, 30, 0.7),
+            Application(25, 35, 0.65),
+            Application(50, 35, 0.6),
+        ),
         "description": "Commercial/intensive",
         "enabled": True,
     },
 }
+
+DEFAULT_FERT_SCENARIOS = MappingProxyType(_DEFAULT_FERT_SCENARIOS)
+
+# Pickled once so callers get independent, mutable deep copies
+_FERT_SNAPSHOT = pickle.dumps(
+    _DEFAULT_FERT_SCENARIOS, protocol=pickle.HIGHEST_PROTOCOL
+)
+
+
+def fresh_defaults() -> Dict:
+    """Return a deep copy of the default fertilizer scenarios."""
+    return pickle.loads(_FERT_SNAPSHOT)
+
+
+def copy_scenarios(scenarios: Dict) -> Dict:
+    """Return a deep copy of a fertilizer scenarios mapping."""
+    return pickle.loads(pickle.dumps(scenarios, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def applications_soa(applications: Iterable[Application]) -> Dict[str, np.ndarray]:
+    """Return an application schedule as parallel day/amount/recovery arrays."""
+    applications = tuple(applications)
+    return {
+        "days": np.array([a[0] for a in applications], dtype=np.int16),
+        "amounts": np.array([a[1] for a in applications], dtype=np.float32),
+        "recoveries": np.array([a[2] for a in applications], dtype=np.float32),
+    }
@@ -1,46 +1,59 @@
 """Location configuration data for Kenya."""
 
-LOCATION_OPTIONS = {
+from types import MappingProxyType
+
+import numpy as np
+
+LOCATION_OPTIONS = MappingProxyType({
     "trans_nzoia": {
         "name": "Trans Nzoia (Kitale)",
         "lat": 1.0167,
         "lon": 35.0000,
-        "best_for": ["barley", "wheat", "potato"],
+        "best_for": ("barley", "wheat", "potato"),
     },
     "narok": {
         "name": "Narok",
         "lat": -1.0833,
         "lon": 35.8667,
-        "best_for": ["wheat", "barley"],
+        "best_for": ("wheat", "barley"),
     },
     "mwea": {
         "name": "Mwea (Kirinyaga)",
         "lat": -0.7333,
         "lon": 37.3500,
-        "best_for": ["rice"],
+        "best_for": ("rice",),
     },
     "busia": {
         "name": "Busia (Western)",
         "lat": 0.4608,
         "lon": 34.1108,
-        "best_for": ["soybean", "groundnut", "cassava"],
+        "best_for": ("soybean", "groundnut", "cassava"),
     },
     "machakos": {
         "name": "Machakos (Eastern)",
         "lat": -1.5177,
         "lon": 37.2634,
-        "best_for": ["cowpea", "sorghum"],
+        "best_for": ("cowpea", "sorghum"),
     },
     "nyandarua": {
         "name": "Nyandarua (Central)",
         "lat": -0.4000,
         "lon": 36.5000,
-        "best_for": ["potato", "wheat"],
+        "best_for": ("potato", "wheat"),
     },
     "kilifi": {
         "name": "Kilifi (Coast)",
         "lat": -3.6305,
         "lon": 39.8499,
-        "best_for": ["cassava", "cowpea"],
+        "best_for": ("cassava", "cowpea"),
     },
-}
+})
+
+# Column views of LOCATION_OPTIONS, row i describing LOC_KEYS[i]
+LOC_KEYS = tuple(LOCATION_OPTIONS)
+LOC_INDEX = MappingProxyType({key: i for i, key in enumerate(LOC_KEYS)})
+LOC_LAT = np.array([LOCATION_OPTIONS[k]["lat"] for k in LOC_KEYS], dtype=np.float32)
+LOC_LON = np.array([LOCATION_OPTIONS[k]["lon"] for k in LOC_KEYS], dtype=np.float32)
+for _column in (LOC_LAT, LOC_LON):
+    _column.setflags(write=False)
+del _column
@@ -1,6 +1,10 @@
 """Soil configuration data."""
 
-SOIL_TYPES = {
+from types import MappingProxyType
+
+import numpy as np
+
+_SOIL_TYPES = {
     "nitisol": {
         "SM0": 0.45,
         "SMFCF": 0.36,
@@ -63,8 +67,36 @@ SOIL_TYPES = {
     },
 }
 
+# Read-only, so presets can be shared with dialogs and runs without copying
+SOIL_TYPES = MappingProxyType(
+    {key: MappingProxyType(soil) for key, soil in _SOIL_TYPES.items()}
+)
+
+# Numeric preset parameters, in SOIL_TABLE field order
+SOIL_PARAMS = (
+    "SM0",
+    "SMFCF",
+    "SMW",
+    "CRAIRC",
+    "RDMSOL",
+    "K0",
+    "SOPE",
+    "KSUB",
+    "NSOILBASE",
+)
+
+# Structured-array view of SOIL_TYPES, row i describing SOIL_KEYS[i]. Kept
+# float64 so presets round-trip exactly into the dialog and the model.
+SOIL_KEYS = tuple(SOIL_TYPES)
+SOIL_INDEX = MappingProxyType({key: i for i, key in enumerate(SOIL_KEYS)})
+SOIL_TABLE = np.array(
+    [tuple(SOIL_TYPES[k][p] for p in SOIL_PARAMS) for k in SOIL_KEYS],
+    dtype=[(p, np.float64) for p in SOIL_PARAMS],
+)
+SOIL_TABLE.setflags(write=False)
+
 # Soil parameter descriptions: (name, description, min_val, max_val)
-SOIL_PARAM_INFO = {
+SOIL_PARAM_INFO = MappingProxyType({
     "SM0": ("Saturation", "Soil moisture at saturation (cm3/cm3)", 0.3, 0.6),
     "SMFCF": ("Field Capacity", "Soil moisture at field capacity (cm3/cm3)", 0.2, 0.5),
     "SMW": ("Wilting Point", "Soil moisture at wilting point (cm3/cm3)", 0.05, 0.3),
@@ -80,4 +112,4 @@ SOIL_PARAM_INFO = {
         0.01,
         0.1,
     ),
-}
+})
@@ -1,6 +1,25 @@
-"""Dialog windows for Kenya Digital Farm Twin."""
+"""Dialog windows for Kenya Digital Farm Twin.
 
-from dialogs.soil_settings import SoilSettingsDialog
-from dialogs.fertilizer_settings import FertilizerSettingsDialog
+Dialog classes are imported on first attribute access (PEP 562).
+"""
+
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    "SoilSettingsDialog": "dialogs.soil_settings",
+    "FertilizerSettingsDialog": "dialogs.fertilizer_settings",
+}
 
 __all__ = ["SoilSettingsDialog", "FertilizerSettingsDialog"]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
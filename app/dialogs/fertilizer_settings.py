@@ -17,7 +17,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from config.fertilizers import DEFAULT_FERT_SCENARIOS
+from config.fertilizers import copy_scenarios, fresh_defaults
 
 
 class FertilizerSettingsDialog(QDialog):
@@ -28,7 +28,7 @@ class FertilizerSettingsDialog(QDialog):
         self.setWindowTitle("Fertilizer Scenarios Settings")
         self.setMinimumSize(700, 500)
 
-        self.fert_scenarios = {k: v.copy() for k, v in fert_scenarios.items()}
+        self.fert_scenarios = copy_scenarios(fert_scenarios)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -79,9 +79,8 @@ class FertilizerSettingsDialog(QDialog):
             # Enabled checkbox
             checkbox = QCheckBox()
             checkbox.setChecked(scenario.get("enabled", True))
-            checkbox.stateChanged.connect(
-                lambda state, k=key: self._toggle_enabled(k, state)
-            )
+            checkbox.setProperty("scenario_key", key)
+            checkbox.stateChanged.connect(self._on_checkbox_changed)
 
             widget = QWidget()
             cb_layout = QHBoxLayout(widget)
@@ -100,19 +99,22 @@ class FertilizerSettingsDialog(QDialog):
             )
             self.table.setItem(row, 4, QTableWidgetItem(scenario["description"]))
 
+        self._row_keys = list(self.fert_scenarios.keys())
+
     def _format_applications(self, apps: List) -> str:
         if not apps:
             return "None"
         return "; ".join([f"Day {d}: {n}kg@{r * 100:.0f}%" for d, n, r in apps])
 
-    def _toggle_enabled(self, key: str, state: int):
+    def _on_checkbox_changed(self, state: int):
+        key = self.sender().property("scenario_key")
         self.fert_scenarios[key]["enabled"] = state == Qt.Checked
 
     def _edit_scenario(self):
         row = self.table.currentRow()
         if row < 0:
             return
-        key = list(self.fert_scenarios.keys())[row]
+        key = self._row_keys[row]
         # Show edit dialog (simplified for now)
         QMessageBox.information(
             self, "Edit", f"Edit scenario: {key}\n(Full editor to be implemented)"
@@ -125,7 +127,7 @@ class FertilizerSettingsDialog(QDialog):
         )
 
     def _reset_defaults(self):
-        self.fert_scenarios = {k: v.copy() for k, v in DEFAULT_FERT_SCENARIOS.items()}
+        self.fert_scenarios = fresh_defaults()
         self._populate_table()
 
     def get_scenarios(self) -> Dict:
@@ -1,6 +1,6 @@
 """Dialog for configuring soil parameters."""
 
-from typing import Dict
+from typing import Dict, Optional
 
 from PyQt5.QtWidgets import (
     QComboBox,
@@ -15,22 +15,51 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
 )
 
-from config.soils import SOIL_TYPES, SOIL_PARAM_INFO
+from config.soils import (
+    SOIL_INDEX,
+    SOIL_PARAM_INFO,
+    SOIL_PARAMS,
+    SOIL_TABLE,
+    SOIL_TYPES,
+)
+
+# Per-parameter widget spec, built once:
+# (param, label, tooltip, min, max, decimals, step, range_text)
+_PARAM_SPEC = tuple(
+    (
+        param,
+        f"{name} ({param}):",
+        desc,
+        min_val,
+        max_val,
+        3 if max_val < 1 else 1,
+        0.01 if max_val < 1 else 1,
+        f"({min_val} - {max_val})",
+    )
+    for param, (name, desc, min_val, max_val) in SOIL_PARAM_INFO.items()
+)
 
 
 class SoilSettingsDialog(QDialog):
-    """Dialog for configuring soil parameters."""
+    """Dialog for configuring soil parameters.
+
+    soil_params None opens the current_soil preset unedited.
+    """
 
-    def __init__(self, current_soil: str, soil_params: Dict, parent=None):
+    def __init__(self, current_soil: str, soil_params: Optional[Dict], parent=None):
         super().__init__(parent)
         self.setWindowTitle("Soil Parameters Settings")
         self.setMinimumSize(600, 500)
 
         self.current_soil = current_soil
-        self.soil_params = soil_params.copy()
+        self.soil_params = dict(soil_params or SOIL_TYPES[current_soil])
         self.param_spinboxes = {}
+        # True while the spinboxes hold an unedited preset
+        self._preset = False
 
         self._setup_ui()
+        if soil_params is None:
+            self._load_preset()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -61,31 +90,38 @@ class SoilSettingsDialog(QDialog):
         params_group = QGroupBox("Soil Parameters (Editable)")
         params_layout = QGridLayout(params_group)
 
-        row = 0
-        for param, (name, desc, min_val, max_val) in SOIL_PARAM_INFO.items():
+        for row, (
+            param,
+            label_text,
+            desc,
+            min_val,
+            max_val,
+            decimals,
+            step,
+            range_text,
+        ) in enumerate(_PARAM_SPEC):
             # Label
-            label = QLabel(f"{name} ({param}):")
+            label = QLabel(label_text)
             label.setToolTip(desc)
             params_layout.addWidget(label, row, 0)
 
             # Spinbox
             spinbox = QDoubleSpinBox()
             spinbox.setRange(min_val, max_val)
-            spinbox.setDecimals(3 if max_val < 1 else 1)
-            spinbox.setSingleStep(0.01 if max_val < 1 else 1)
+            spinbox.setDecimals(decimals)
+            spinbox.setSingleStep(step)
             spinbox.setValue(self.soil_params.get(param, (min_val + max_val) / 2))
             spinbox.setToolTip(desc)
             params_layout.addWidget(spinbox, row, 1)
 
+            spinbox.valueChanged.connect(self._on_param_edited)
             self.param_spinboxes[param] = spinbox
 
             # Unit/range label
-            unit_label = QLabel(f"({min_val} - {max_val})")
+            unit_label = QLabel(range_text)
             unit_label.setStyleSheet("color: gray;")
             params_layout.addWidget(unit_label, row, 2)
 
-            row += 1
-
         layout.addWidget(params_group)
 
         # Buttons
@@ -96,13 +132,21 @@ class SoilSettingsDialog(QDialog):
 
     def _load_preset(self):
         soil_key = self.soil_combo.currentData()
-        if soil_key in SOIL_TYPES:
-            soil = SOIL_TYPES[soil_key]
+        if soil_key in SOIL_INDEX:
+            soil = SOIL_TABLE[SOIL_INDEX[soil_key]]
             for param, spinbox in self.param_spinboxes.items():
-                if param in soil:
-                    spinbox.setValue(soil[param])
+                if param in SOIL_PARAMS:
+                    spinbox.setValue(float(soil[param]))
                 elif param == "NSOILBASE_FR":
                     spinbox.setValue(0.025)
+            self._preset = True
+
+    def _on_param_edited(self):
+        self._preset = False
+
+    def is_preset(self) -> bool:
+        """Return True if the parameters are the selected preset, unedited."""
+        return self._preset
 
     def get_soil_params(self) -> Dict:
         params = {}
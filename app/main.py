@@ -4,16 +4,31 @@
 Entry point for the PyQt5 application.
 """
 
+import multiprocessing
 import sys
 
-import matplotlib
 from PyQt5.QtGui import QColor, QPalette
 from PyQt5.QtWidgets import QApplication
 
-matplotlib.use("Qt5Agg")
-
+from simulation import shutdown_pool
 from windows import MainWindow
 
+# Application palette as (role, RGB); applied once the QApplication exists
+_PALETTE_COLORS = (
+    (QPalette.Window, (248, 249, 250)),
+    (QPalette.WindowText, (33, 37, 41)),
+    (QPalette.Base, (255, 255, 255)),
+    (QPalette.AlternateBase, (248, 249, 250)),
+    (QPalette.ToolTipBase, (255, 255, 255)),
+    (QPalette.ToolTipText, (33, 37, 41)),
+    (QPalette.Text, (33, 37, 41)),
+    (QPalette.Button, (248, 249, 250)),
+    (QPalette.ButtonText, (33, 37, 41)),
+    (QPalette.BrightText, (255, 0, 0)),
+    (QPalette.Highlight, (39, 174, 96)),
+    (QPalette.HighlightedText, (255, 255, 255)),
+)
+
 
 def main():
     """Main entry point for the application."""
@@ -22,20 +37,13 @@ def main():
 
     # Set application palette
     palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(248, 249, 250))
-    palette.setColor(QPalette.WindowText, QColor(33, 37, 41))
-    palette.setColor(QPalette.Base, QColor(255, 255, 255))
-    palette.setColor(QPalette.AlternateBase, QColor(248, 249, 250))
-    palette.setColor(QPalette.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ToolTipText, QColor(33, 37, 41))
-    palette.setColor(QPalette.Text, QColor(33, 37, 41))
-    palette.setColor(QPalette.Button, QColor(248, 249, 250))
-    palette.setColor(QPalette.ButtonText, QColor(33, 37, 41))
-    palette.setColor(QPalette.BrightText, QColor(255, 0, 0))
-    palette.setColor(QPalette.Highlight, QColor(39, 174, 96))
-    palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+    for role, rgb in _PALETTE_COLORS:
+        palette.setColor(role, QColor(*rgb))
     app.setPalette(palette)
 
+    # Don't block quitting on queued scenarios in the worker processes
+    app.aboutToQuit.connect(shutdown_pool)
+
     window = MainWindow()
     window.show()
 
@@ -43,4 +51,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Scenario worker processes re-enter here in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
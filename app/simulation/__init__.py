@@ -1,5 +1,18 @@
 """Simulation module for WOFOST crop modeling."""
 
-from simulation.worker import SimulationWorker
+from simulation.results import ScenarioResult, result_arrays
+from simulation.worker import (
+    SimulationConfig,
+    SimulationSignals,
+    SimulationWorker,
+    shutdown_pool,
+)
 
-__all__ = ["SimulationWorker"]
+__all__ = [
+    "ScenarioResult",
+    "SimulationConfig",
+    "SimulationSignals",
+    "SimulationWorker",
+    "result_arrays",
+    "shutdown_pool",
+]
@@ -0,0 +1,53 @@
+"""Per-scenario simulation results and column arrays built from them."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """Outcome of one fertilizer scenario run."""
+
+    df: pd.DataFrame
+    summary: Dict
+    yield_kg: float
+    yield_t: float
+    scenario: str
+    scenario_key: str
+    n_rate: float
+    tagp: float
+    laimax: float
+    # (weather_df, daily, cumulative) from the last gdd() call
+    _gdd: Optional[Tuple[pd.DataFrame, np.ndarray, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def gdd(self, weather_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (daily, cumulative) GDD over the simulated days.
+
+        Read from weather_df's "daily_GDD" column and cached per weather frame.
+        """
+        if self._gdd is None or self._gdd[0] is not weather_df:
+            days = self.df["day"].dt.normalize()
+            daily = weather_df["daily_GDD"].reindex(days).fillna(0.0)
+            daily = daily.to_numpy(dtype=np.float32)
+            self._gdd = (weather_df, daily, np.cumsum(daily))
+        return self._gdd[1:]
+
+
+def result_arrays(results: List[ScenarioResult]) -> Dict[str, np.ndarray]:
+    """Return per-scenario summary columns as NumPy arrays.
+
+    Built once when a run finishes and shared by the results table and
+    plots. Biomass ("tagp") is converted to t/ha.
+    """
+    return {
+        "scenario": np.array([r.scenario for r in results], dtype=object),
+        "n_rate": np.asarray([r.n_rate for r in results], dtype=np.float64),
+        "yield_t": np.asarray([r.yield_t for r in results], dtype=np.float64),
+        "tagp": np.asarray([r.tagp for r in results], dtype=np.float64) / 1000,
+        "laimax": np.asarray([r.laimax for r in results], dtype=np.float64),
+    }
@@ -1,246 +1,322 @@
 """WOFOST simulation worker thread."""
 
-from datetime import date, timedelta
-from typing import Dict
-
+import logging
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
 import pandas as pd
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
 
 from config.crops import CROP_OPTIONS
+from config.fertilizers import Application, applications_soa
+from config.soils import SOIL_INDEX, SOIL_PARAMS, SOIL_TABLE
+from simulation.results import ScenarioResult
+
+logger = logging.getLogger(__name__)
+
+# Base temperature for growing degree day accumulation (C)
+TBASE = 0.0
+
+# On-disk cache of per-location weather years
+WEATHER_CACHE_DIR = Path.home() / ".cache" / "kenya_farm_twin"
+WEATHER_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+# Upper bound on scenario worker processes
+MAX_SCENARIO_WORKERS = 4
+
+# Minimum seconds between per-scenario progress signals
+PROGRESS_INTERVAL = 0.2
+
+
+@lru_cache(maxsize=32)
+def _get_weather(lat: float, lon: float):
+    """Return a NASA POWER weather provider, reused across runs per location.
+
+    PCSE's own meteo cache is pointed at WEATHER_CACHE_DIR so a fresh
+    process can load the provider from disk instead of the POWER API.
+    """
+    from pcse import settings
+    from pcse.input import NASAPowerWeatherDataProvider
+
+    meteo_dir = WEATHER_CACHE_DIR / "meteo"
+    try:
+        meteo_dir.mkdir(parents=True, exist_ok=True)
+        settings.METEO_CACHE_DIR = str(meteo_dir)
+    except OSError as e:
+        logger.warning("Could not create meteo cache: %s", e)
+    return NASAPowerWeatherDataProvider(latitude=lat, longitude=lon)
+
+
+@lru_cache(maxsize=None)
+def _get_cropd():
+    """Return the WOFOST 8.1 YAML crop data provider, parsed once per process."""
+    from pcse.input import YAMLCropDataProvider
+    from pcse.models import Wofost81_NWLP_CWB_CNB
+
+    return YAMLCropDataProvider(Wofost81_NWLP_CWB_CNB)
 
 
-class SimulationWorker(QThread):
-    """Worker thread for running WOFOST simulations."""
+@lru_cache(maxsize=4)
+def _get_params(crop_name: str, soil_items: tuple, site_items: tuple):
+    """Return a ParameterProvider for the crop, soil and site, built once.
+
+    Scenarios only differ in agromanagement and overrides, so callers reuse
+    the provider and reset it with clear_override() before each run.
+    """
+    from pcse.base import ParameterProvider
+
+    return ParameterProvider(
+        cropdata=_get_cropd(), soildata=dict(soil_items), sitedata=dict(site_items)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the scenario process pool, started once and kept across runs.
+
+    PCSE is pure Python, so scenarios need processes to run in parallel.
+    Workers are spawned rather than forked because the parent runs Qt threads.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max(1, min(MAX_SCENARIO_WORKERS, os.cpu_count() or 1)),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_pool():
+    """Stop the scenario pool without waiting, dropping queued scenarios.
+
+    Called when the application quits; scenarios already running in a
+    worker process still finish there.
+    """
+    if _get_pool.cache_info().currsize:
+        _get_pool().shutdown(wait=False, cancel_futures=True)
+        _get_pool.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _year_days(year: int) -> pd.DatetimeIndex:
+    """Return the daily DatetimeIndex for a calendar year."""
+    return pd.date_range(date(year, 1, 1), date(year, 12, 31), name="date")
+
+
+def _build_weather_df(weather, year: int) -> pd.DataFrame:
+    """Read one calendar year from the weather provider into a DataFrame.
+
+    Values are filled into column arrays; days the provider cannot serve
+    stay NaN and are dropped.
+    """
+    dates = _year_days(year)
+    n_days = len(dates)
+    tmax = np.full(n_days, np.nan, dtype=np.float32)
+    tmin = np.full(n_days, np.nan, dtype=np.float32)
+    rain = np.full(n_days, np.nan, dtype=np.float32)
+    radiation = np.full(n_days, np.nan, dtype=np.float32)
+    missing = 0
+    for i, d in enumerate(dates):
+        try:
+            w = weather(d.date())
+            tmax[i] = w.TMAX
+            tmin[i] = w.TMIN
+            rain[i] = w.RAIN
+            radiation[i] = w.IRRAD / 1000000  # Convert J/m2 to MJ/m2
+        except Exception:
+            missing += 1
+    if missing:
+        logger.debug("Weather gaps in %d: %d days", year, missing)
+    weather_df = pd.DataFrame(
+        {"tmax": tmax, "tmin": tmin, "rain": rain, "radiation": radiation},
+        index=dates,
+    ).dropna()
+    weather_df["daily_GDD"] = np.maximum(
+        0.0, (weather_df["tmax"] + weather_df["tmin"]) / 2.0 - TBASE
+    )
+    return weather_df
+
+
+def _weather_cache_path(lat: float, lon: float, year: int) -> Path:
+    return WEATHER_CACHE_DIR / f"weather_{lat:.4f}_{lon:.4f}_{year}.pkl"
+
+
+def _read_weather_cache(path: Path) -> Optional[pd.DataFrame]:
+    """Return the cached weather DataFrame, or None if missing or stale."""
+    try:
+        if time.time() - path.stat().st_mtime > WEATHER_CACHE_MAX_AGE:
+            return None
+        return pickle.loads(path.read_bytes())
+    except Exception:
+        return None
+
+
+def _write_weather_cache(path: Path, weather_df: pd.DataFrame):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(pickle.dumps(weather_df, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError as e:
+        logger.warning("Could not write weather cache: %s", e)
+
+
+@dataclass(slots=True, frozen=True)
+class SimulationConfig:
+    """Inputs for one simulation run."""
+
+    crop: str
+    location: Mapping
+    soil_type: str
+    # None runs the unedited soil_type preset
+    soil_params: Optional[Mapping]
+    fert_scenarios: Mapping
+    start_date: date
+
+
+class SimulationSignals(QObject):
+    """Signals emitted by a SimulationWorker (QRunnable is not a QObject)."""
 
     progress = pyqtSignal(int, str)
-    finished = pyqtSignal(list, dict, object, int, str)
+    # object, not list/dict: those are converted to QVariantList/Map and
+    # copied on delivery, while object passes the Python references through
+    finished = pyqtSignal(object, object, object, int, str)
     error = pyqtSignal(str)
 
-    def __init__(self, config: Dict):
+
+class SimulationWorker(QRunnable):
+    """Runnable for WOFOST simulations, started on a QThreadPool."""
+
+    def __init__(self, config: SimulationConfig):
         super().__init__()
         self.config = config
+        self.signals = SimulationSignals()
+        self.progress = self.signals.progress
+        self.finished = self.signals.finished
+        self.error = self.signals.error
 
     def run(self):
         try:
-            # Import PCSE modules
-            self.progress.emit(5, "Importing PCSE modules...")
-            from pcse.base import ParameterProvider
-            from pcse.input import NASAPowerWeatherDataProvider, YAMLCropDataProvider
-            from pcse.models import Wofost81_NWLP_CWB_CNB
-
             # Get configuration
-            crop_name = self.config["crop"]
-            crop_config = CROP_OPTIONS[crop_name]
-            location = self.config["location"]
-            soil_params = self.config["soil_params"]
-            fert_scenarios = self.config["fert_scenarios"]
-            start_date = self.config["start_date"]
+            crop_name = self.config.crop
+            location = self.config.location
+            soil_type = self.config.soil_type
+            soil_params = self.config.soil_params
+            fert_scenarios = self.config.fert_scenarios
+            start_date = self.config.start_date
             year = start_date.year
 
+            enabled = [
+                (key, scenario)
+                for key, scenario in fert_scenarios.items()
+                if scenario.get("enabled", True)
+            ]
+            if not enabled:
+                self.error.emit("No fertilizer scenarios are enabled.")
+                return
+
             # Load weather data
             self.progress.emit(15, f"Loading weather for {location['name']}...")
-            weather = NASAPowerWeatherDataProvider(
-                latitude=location["lat"], longitude=location["lon"]
-            )
-
-            # Store weather data for plotting
-            year = start_date.year
-            weather_data = []
-            for d in pd.date_range(date(year, 1, 1), date(year, 12, 31)):
-                try:
-                    w = weather(d.date())
-                    weather_data.append({
-                        'date': d,
-                        'tmax': w.TMAX,
-                        'tmin': w.TMIN,
-                        'rain': w.RAIN,
-                        'radiation': w.IRRAD / 1000000,  # Convert J/m2 to MJ/m2
-                    })
-                except Exception as e:
-                    print(e)
-                    pass
-            self.weather_df = pd.DataFrame(weather_data).set_index('date')
+            lat, lon = round(location["lat"], 4), round(location["lon"], 4)
+
+            # Weather year for plotting and GDD, from disk cache when fresh;
+            # scenario processes build their own providers
+            cache_path = _weather_cache_path(lat, lon, year)
+            self.weather_df = _read_weather_cache(cache_path)
+            if self.weather_df is None:
+                self.weather_df = _build_weather_df(_get_weather(lat, lon), year)
+                _write_weather_cache(cache_path, self.weather_df)
             self.weather_year = year
             self.location_name = location['name']
 
-            results = []
-            dataframes = {}
-            total_scenarios = len(
-                [s for s in fert_scenarios.values() if s.get("enabled", True)]
+            # Agromanagement dates are the same for every scenario
+            planting_date = date(year, start_date.month, start_date.day)
+            offsets = np.unique(
+                np.concatenate([
+                    applications_soa(scenario["applications"])["days"]
+                    for _, scenario in enabled
+                ])
             )
-            completed = 0
-
-            for key, scenario in fert_scenarios.items():
-                if not scenario.get("enabled", True):
-                    continue
-
-                progress_pct = 20 + int(70 * completed / total_scenarios)
-                self.progress.emit(progress_pct, f"Running: {scenario['name']}...")
-
-                # Build agromanagement
-                planting_date = date(year, start_date.month, start_date.day)
-                end_date = date(year, 12, 31)
-                max_duration = crop_config["season_days"]
-
-                # Build timed events for N applications
-                timed_events = None
-                if scenario["applications"]:
-                    timed_events = []
-                    for i, (days, amount, recovery) in enumerate(
-                        scenario["applications"]
-                    ):
-                        app_date = planting_date + timedelta(days=days)
-                        timed_events.append(
-                            {
-                                "event_signal": "apply_n",
-                                "name": f"N application {i + 1}",
-                                "comment": f"{amount} kg N/ha",
-                                "events_table": [
-                                    {
-                                        app_date: {
-                                            "N_amount": amount,
-                                            "N_recovery": recovery,
-                                        }
-                                    }
-                                ],
-                            }
-                        )
-
-                agro = {
-                    "Version": 1.0,
-                    "AgroManagement": [
-                        {
-                            planting_date: {
-                                "CropCalendar": {
-                                    "crop_name": crop_name,
-                                    "variety_name": crop_config["variety"],
-                                    "crop_start_date": planting_date,
-                                    "crop_start_type": "emergence",
-                                    "crop_end_date": end_date,
-                                    "crop_end_type": "earliest",
-                                    "max_duration": max_duration,
-                                },
-                                "TimedEvents": timed_events,
-                                "StateEvents": None,
-                            }
-                        }
-                    ],
-                }
-
-                # Create crop data provider
-                cropd = YAMLCropDataProvider(Wofost81_NWLP_CWB_CNB)
-                cropd.set_active_crop(crop_name, crop_config["variety"])
-
-                # Build soil data
-                soildata = {
-                    "SM0": soil_params["SM0"],
-                    "SMFCF": soil_params["SMFCF"],
-                    "SMW": soil_params["SMW"],
-                    "CRAIRC": soil_params["CRAIRC"],
-                    "RDMSOL": soil_params["RDMSOL"],
-                    "K0": soil_params["K0"],
-                    "SOPE": soil_params["SOPE"],
-                    "KSUB": soil_params["KSUB"],
-                    "IFUNRN": 0,
-                    "SSMAX": 0.0,
-                    "SSI": 0.0,
-                    "WAV": 50.0,
-                    "NOTINF": 0.0,
-                    "SMLIM": soil_params["SMFCF"],
-                    "NSOILBASE": soil_params["NSOILBASE"],
-                    "NSOILBASE_FR": soil_params.get("NSOILBASE_FR", 0.025),
-                }
-
-                sitedata = {
-                    "CO2": 415.0,
-                    "NAVAILI": 20.0,
-                    "BG_N_SUPPLY": 0.5,
-                }
-
-                # Create parameters
-                params = ParameterProvider(
-                    cropdata=cropd, soildata=soildata, sitedata=sitedata
-                )
-
-                # Apply vernalization override if needed
-                if crop_config.get("needs_vern_override"):
-                    params.set_override("VERNSAT", 0)
-                    params.set_override("VERNBASE", 0)
-                    params.set_override("VERNDVS", 0)
-
+            app_dates = np.datetime64(planting_date, "D") + offsets.astype("m8[D]")
+            offset_to_date = dict(zip(offsets.tolist(), app_dates.astype(object)))
+
+            # Build soil data
+            if soil_params is None:
+                preset = SOIL_TABLE[SOIL_INDEX[soil_type]]
+                soildata = {p: float(preset[p]) for p in SOIL_PARAMS}
+                n_fraction = 0.025
+            else:
+                soildata = {p: soil_params[p] for p in SOIL_PARAMS}
+                n_fraction = soil_params.get("NSOILBASE_FR", 0.025)
+            soildata.update({
+                "IFUNRN": 0,
+                "SSMAX": 0.0,
+                "SSI": 0.0,
+                "WAV": 50.0,
+                "NOTINF": 0.0,
+                "SMLIM": soildata["SMFCF"],
+                "NSOILBASE_FR": n_fraction,
+            })
+
+            sitedata = {
+                "CO2": 415.0,
+                "NAVAILI": 20.0,
+                "BG_N_SUPPLY": 0.5,
+            }
+
+            # Scenarios are independent, so run them in worker processes
+            self.progress.emit(20, f"Running {len(enabled)} scenarios...")
+            pool = _get_pool()
+            futures = {
+                pool.submit(
+                    _run_one_scenario,
+                    key,
+                    scenario,
+                    crop_name,
+                    lat,
+                    lon,
+                    soildata,
+                    sitedata,
+                    planting_date,
+                    offset_to_date,
+                ): (key, scenario)
+                for key, scenario in enabled
+            }
+            outcomes = {}
+            last_emit = 0.0
+            for completed, future in enumerate(as_completed(futures), 1):
+                key, scenario = futures[future]
                 try:
-                    model = Wofost81_NWLP_CWB_CNB(params, weather, agro)
-                    model.run_till_terminate()
-
-                    output = model.get_output()
-                    df = pd.DataFrame(output)
-                    summary = model.get_summary_output()
-
-                    if summary and len(summary) > 0:
-                        s = summary[0]
-                        grain_yield = s.get("TWSO", 0)
-
-                        if crop_name in ["potato", "cassava", "sweetpotato"]:
-                            main_yield = (
-                                grain_yield
-                                if grain_yield > 0
-                                else s.get("TAGP", 0) * 0.5
-                            )
-                        else:
-                            main_yield = (
-                                grain_yield
-                                if grain_yield > 0
-                                else s.get("TAGP", 0) * 0.4
-                            )
-
-                            # Calculate GDD from weather data
-                            gdd_list = []
-                            daily_gdd_list = []
-                            tbase = 0.0  # Base temperature
-                            cumulative_gdd = 0.0
-                            for d in df['day']:
-                                try:
-                                    # Convert to date object for weather provider
-                                    if hasattr(d, 'date'):
-                                        d_date = d.date()
-                                    elif hasattr(d, 'timetuple'):
-                                        d_date = d
-                                    else:
-                                        d_date = pd.Timestamp(d).date()
-
-                                    wdata = weather(d_date)
-                                    tmax = wdata.TMAX
-                                    tmin = wdata.TMIN
-                                    daily_gdd = max(0.0, (tmax + tmin) / 2.0 - tbase)
-                                except Exception as e:
-                                    print(e)
-                                    daily_gdd = 0.0
-
-                                cumulative_gdd += daily_gdd
-                                daily_gdd_list.append(daily_gdd)
-                                gdd_list.append(cumulative_gdd)
-
-                            df['GDD'] = gdd_list
-                            df['daily_GDD'] = daily_gdd_list
-
-                            results.append({
-                                'df': df,
-                                'summary': s,
-                                'yield_kg': main_yield,
-                                'yield_t': main_yield / 1000,
-                                'scenario': scenario['name'],
-                                'scenario_key': key,
-                                'n_rate': scenario['total_n'],
-                                'tagp': s.get('TAGP', 0),
-                                'laimax': s.get('LAIMAX', 0),
-                            })
-
-                        dataframes[scenario["name"]] = df
-
-                except Exception as e:
-                    print(f"Error in scenario {key}: {e}")
-
-                completed += 1
+                    outcomes[key] = future.result()
+                except CancelledError:
+                    # The pool was shut down at quit
+                    continue
+                except BrokenProcessPool:
+                    # A dead worker breaks the pool; start a fresh one next run
+                    _get_pool.cache_clear()
+                    raise
+                except Exception:
+                    logger.exception("Error in scenario %s", key)
+                # Coalesce bursts of completions into one signal per interval
+                now = time.monotonic()
+                if completed == len(enabled) or now - last_emit >= PROGRESS_INTERVAL:
+                    last_emit = now
+                    progress_pct = 20 + int(70 * completed / len(enabled))
+                    self.progress.emit(progress_pct, f"Finished: {scenario['name']}")
+
+            # Keep results in scenario order regardless of completion order
+            results: List[ScenarioResult] = []
+            dataframes: Dict[str, pd.DataFrame] = {}
+            for key, scenario in enabled:
+                outcome = outcomes.get(key)
+                if outcome is not None:
+                    results.append(outcome)
+                    dataframes[scenario["name"]] = outcome.df
 
             self.progress.emit(95, "Finalizing results...")
             self.progress.emit(100, "Done!")
@@ -252,3 +328,116 @@ class SimulationWorker(QThread):
             import traceback
 
             self.error.emit(f"Simulation error: {str(e)}\n{traceback.format_exc()}")
+
+
+def _run_one_scenario(
+    key: str,
+    scenario: Dict,
+    crop_name: str,
+    lat: float,
+    lon: float,
+    soildata: Dict,
+    sitedata: Dict,
+    planting_date: date,
+    offset_to_date: Dict[int, date],
+) -> Optional[ScenarioResult]:
+    """Run WOFOST for one fertilizer scenario and return its result.
+
+    Runs in a worker process: the weather and crop providers come from that
+    process's own caches (PCSE keeps NASA POWER data in its on-disk cache).
+    """
+    from pcse.models import Wofost81_NWLP_CWB_CNB
+
+    crop_config = CROP_OPTIONS[crop_name]
+    weather = _get_weather(lat, lon)
+    cropd = _get_cropd()
+    # Workers are reused, so the crop is usually already active
+    active = (cropd.current_crop_name, cropd.current_variety_name)
+    if active != (crop_name, crop_config["variety"]):
+        cropd.set_active_crop(crop_name, crop_config["variety"])
+
+    # Build timed events for N applications
+    timed_events = [
+        {
+            "event_signal": "apply_n",
+            "name": f"N application {i + 1}",
+            "comment": f"{app.amount} kg N/ha",
+            "events_table": [
+                {
+                    offset_to_date[app.day]: {
+                        "N_amount": app.amount,
+                        "N_recovery": app.recovery,
+                    }
+                }
+            ],
+        }
+        for i, app in enumerate(map(Application._make, scenario["applications"]))
+    ] or None
+
+    agro = {
+        "Version": 1.0,
+        "AgroManagement": [
+            {
+                planting_date: {
+                    "CropCalendar": {
+                        "crop_name": crop_name,
+                        "variety_name": crop_config["variety"],
+                        "crop_start_date": planting_date,
+                        "crop_start_type": "emergence",
+                        "crop_end_date": date(planting_date.year, 12, 31),
+                        "crop_end_type": "earliest",
+                        "max_duration": crop_config["season_days"],
+                    },
+                    "TimedEvents": timed_events,
+                    "StateEvents": None,
+                }
+            }
+        ],
+    }
+
+    # Reuse this process's provider; drop overrides left by the last scenario
+    params = _get_params(
+        crop_name, tuple(sorted(soildata.items())), tuple(sorted(sitedata.items()))
+    )
+    params.clear_override()
+
+    # Apply vernalization override if needed
+    if crop_config.get("needs_vern_override"):
+        params.set_override("VERNSAT", 0)
+        params.set_override("VERNBASE", 0)
+        params.set_override("VERNDVS", 0)
+
+    model = Wofost81_NWLP_CWB_CNB(params, weather, agro)
+    model.run_till_terminate()
+
+    # Half-width floats and a datetime64 day column: smaller to pickle back
+    # from the worker and to pass through the plots
+    output = model.get_output()
+    df = pd.DataFrame(output)
+    num_cols = df.select_dtypes("float64").columns
+    df[num_cols] = df[num_cols].astype(np.float32)
+    df["day"] = pd.to_datetime(df["day"])
+    summary = model.get_summary_output()
+
+    if not summary:
+        return None
+
+    s = summary[0]
+    grain_yield = s.get("TWSO", 0)
+
+    if crop_name in ["potato", "cassava", "sweetpotato"]:
+        main_yield = grain_yield if grain_yield > 0 else s.get("TAGP", 0) * 0.5
+    else:
+        main_yield = grain_yield if grain_yield > 0 else s.get("TAGP", 0) * 0.4
+
+    return ScenarioResult(
+        df=df,
+        summary=s,
+        yield_kg=main_yield,
+        yield_t=main_yield / 1000,
+        scenario=scenario["name"],
+        scenario_key=key,
+        n_rate=scenario["total_n"],
+        tagp=s.get("TAGP", 0),
+        laimax=s.get("LAIMAX", 0),
+    )
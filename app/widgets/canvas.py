@@ -1,9 +1,12 @@
 """Matplotlib canvas widgets for embedding in PyQt5."""
 
+import matplotlib
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
 from PyQt5.QtGui import QFont
 from PyQt5.QtCore import Qt
 
+matplotlib.use("Qt5Agg")
+
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
@@ -12,8 +15,12 @@ from matplotlib.figure import Figure
 class MplCanvas(FigureCanvas):
     """A Matplotlib canvas for embedding in PyQt."""
 
-    def __init__(self, parent=None, width=8, height=6, dpi=100):
-        self.fig = Figure(figsize=(width, height), dpi=dpi)
+    def __init__(self, parent=None, width=8, height=6, dpi=None):
+        # Default to the screen's logical DPI so the raster matches the widget
+        if dpi is None:
+            dpi = parent.logicalDpiX() if parent is not None else 96
+        # Constrained layout re-solves on draw, so plots don't call tight_layout
+        self.fig = Figure(figsize=(width, height), dpi=dpi, layout="constrained")
         self.fig.set_facecolor("#f8f9fa")
         super().__init__(self.fig)
         self.setParent(parent)
@@ -21,11 +28,23 @@ class MplCanvas(FigureCanvas):
 
 
 class GraphWidget(QWidget):
-    """Widget containing a matplotlib canvas with navigation toolbar."""
+    """Widget containing a matplotlib canvas with navigation toolbar.
+
+    The canvas and toolbar are built on first show or first access of
+    canvas, so tabs the user never opens don't construct a figure.
+    """
 
     def __init__(self, title="Graph", parent=None):
         super().__init__(parent)
         self.title = title
+        # Stateful plot renderer drawing into this widget, if any
+        self.plot = None
+        # PlotContext.signature() of the last render, to skip identical ones.
+        # The context is kept too, so the ids in the signature stay unique.
+        self.signature = None
+        self.context = None
+        self._canvas = None
+        self.toolbar = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -36,14 +55,32 @@ class GraphWidget(QWidget):
         self.title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.title_label)
 
+    @property
+    def canvas(self) -> MplCanvas:
+        if self._canvas is None:
+            self._build_canvas()
+        return self._canvas
+
+    def _build_canvas(self):
+        layout = self.layout()
+
         # Canvas
-        self.canvas = MplCanvas(self, width=8, height=5, dpi=100)
-        layout.addWidget(self.canvas)
+        self._canvas = MplCanvas(self, width=8, height=5)
+        layout.addWidget(self._canvas)
 
-        # Toolbar
-        self.toolbar = NavigationToolbar(self.canvas, self)
+        # Toolbar (no coordinate readout: it rebuilds a label on every mouse move)
+        self.toolbar = NavigationToolbar(self._canvas, self, coordinates=False)
         layout.addWidget(self.toolbar)
 
+    def showEvent(self, event):
+        if self._canvas is None:
+            self._build_canvas()
+        super().showEvent(event)
+
     def clear(self):
-        self.canvas.fig.clear()
-        self.canvas.draw()
+        self.plot = None
+        self.signature = None
+        self.context = None
+        if self._canvas is not None:
+            self._canvas.fig.clear()
+            self._canvas.draw_idle()
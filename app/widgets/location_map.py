@@ -1,10 +1,15 @@
 """Interactive map widget for selecting locations in Kenya."""
 
+import numpy as np
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
 from PyQt5.QtCore import pyqtSignal
 
 from widgets.canvas import MplCanvas
-from config.locations import LOCATION_OPTIONS
+from config.locations import LOC_INDEX, LOC_KEYS, LOC_LAT, LOC_LON, LOCATION_OPTIONS
+
+# Location coordinates as an (N, 2) lon/lat array for click lookup
+_LOC_XY = np.column_stack([LOC_LON, LOC_LAT])
+_LOC_XY.setflags(write=False)
 
 
 class LocationMapWidget(QWidget):
@@ -15,24 +20,29 @@ class LocationMapWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_location = "trans_nzoia"
+
         self._setup_ui()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
 
         # Canvas
-        self.canvas = MplCanvas(self, width=5, height=4, dpi=100)
+        self.canvas = MplCanvas(self, width=5, height=4)
         layout.addWidget(self.canvas)
 
         # Connect click event
         self.canvas.mpl_connect("button_press_event", self._on_click)
 
-        # Draw initial map
-        self._draw_map()
+        # Re-capture the static background after every full draw (incl. resize)
+        self._bg = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+        # Draw the static map once; selection changes only restyle artists
+        self._build_map_once()
 
-    def _draw_map(self):
-        self.canvas.fig.clear()
+    def _build_map_once(self):
         ax = self.canvas.fig.add_subplot(111)
+        self._ax = ax
 
         # Draw simplified Kenya outline
         kenya_outline_lon = [34, 42, 42, 41, 40, 34, 34]
@@ -40,29 +50,43 @@ class LocationMapWidget(QWidget):
         ax.plot(kenya_outline_lon, kenya_outline_lat, "k-", linewidth=2, alpha=0.5)
         ax.fill(kenya_outline_lon, kenya_outline_lat, color="#e8f5e9", alpha=0.3)
 
-        # Plot locations
+        # Plot locations as two collections: all unselected points ("o"), and
+        # the selected point ("*") as its own layer since a collection's
+        # marker can't be changed. The selected point gets size 0 in the
+        # first layer.
+        sel = LOC_INDEX[self.selected_location]
+        self._normal_markers = ax.scatter(
+            _LOC_XY[:, 0],
+            _LOC_XY[:, 1],
+            c="#757575",
+            s=self._normal_sizes(sel),
+            marker="o",
+            edgecolors="white",
+            linewidths=2,
+            zorder=5,
+            animated=True,
+        )
+        self._selected_marker = ax.scatter(
+            _LOC_XY[sel : sel + 1, 0],
+            _LOC_XY[sel : sel + 1, 1],
+            c="#2196F3",
+            s=150,
+            marker="*",
+            edgecolors="white",
+            linewidths=2,
+            zorder=5,
+            animated=True,
+        )
+        self._label_artists = {}
         for key, loc in LOCATION_OPTIONS.items():
-            color = "#2196F3" if key == self.selected_location else "#757575"
-            size = 150 if key == self.selected_location else 80
-            marker = "*" if key == self.selected_location else "o"
-
-            ax.scatter(
-                loc["lon"],
-                loc["lat"],
-                c=color,
-                s=size,
-                marker=marker,
-                edgecolors="white",
-                linewidths=2,
-                zorder=5,
-            )
-            ax.annotate(
+            self._label_artists[key] = ax.annotate(
                 loc["name"].split("(")[0].strip(),
                 (loc["lon"], loc["lat"]),
                 xytext=(5, 5),
                 textcoords="offset points",
                 fontsize=8,
                 fontweight="bold" if key == self.selected_location else "normal",
+                animated=True,
             )
 
         ax.set_xlim(33, 43)
@@ -73,31 +97,61 @@ class LocationMapWidget(QWidget):
         ax.grid(True, alpha=0.3)
         ax.set_aspect("equal")
 
-        self.canvas.fig.tight_layout()
         self.canvas.draw()
 
+    def _selection_artists(self):
+        yield self._normal_markers
+        yield self._selected_marker
+        yield from self._label_artists.values()
+
+    def _draw_selection(self):
+        for artist in self._selection_artists():
+            self._ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        # Markers and labels are animated, so the full draw leaves them out
+        self._bg = self.canvas.copy_from_bbox(self._ax.bbox)
+        self._draw_selection()
+
+    def _normal_sizes(self, selected_index: int) -> np.ndarray:
+        sizes = np.full(len(LOC_KEYS), 80.0)
+        sizes[selected_index] = 0.0
+        return sizes
+
+    def _update_selection(self, old_key: str, new_key: str):
+        if old_key == new_key:
+            return
+        sel = LOC_INDEX[new_key]
+        self._normal_markers.set_sizes(self._normal_sizes(sel))
+        self._selected_marker.set_offsets(_LOC_XY[sel : sel + 1])
+        self._label_artists[old_key].set_fontweight("normal")
+        self._label_artists[new_key].set_fontweight("bold")
+
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        # Blit: restore the static map and redraw only the selection layer
+        self.canvas.restore_region(self._bg)
+        self._draw_selection()
+        self.canvas.blit(self._ax.bbox)
+
     def _on_click(self, event):
         if event.xdata is None or event.ydata is None:
             return
 
-        # Find closest location
-        min_dist = float("inf")
-        closest = None
+        # Find closest location (squared distance, within 2 degrees)
+        d2 = ((_LOC_XY - np.array([event.xdata, event.ydata])) ** 2).sum(axis=1)
+        i = int(d2.argmin())
 
-        for key, loc in LOCATION_OPTIONS.items():
-            dist = (
-                (loc["lon"] - event.xdata) ** 2 + (loc["lat"] - event.ydata) ** 2
-            ) ** 0.5
-            if dist < min_dist:
-                min_dist = dist
-                closest = key
-
-        if closest and min_dist < 2:  # Within 2 degrees
+        if d2[i] < 4.0:
+            closest = LOC_KEYS[i]
+            old_key = self.selected_location
             self.selected_location = closest
-            self._draw_map()
+            self._update_selection(old_key, closest)
             self.location_selected.emit(closest)
 
     def set_location(self, location_key: str):
-        if location_key in LOCATION_OPTIONS:
+        if location_key in LOCATION_OPTIONS and location_key != self.selected_location:
+            old_key = self.selected_location
             self.selected_location = location_key
-            self._draw_map()
+            self._update_selection(old_key, location_key)
@@ -1,10 +1,13 @@
 """Main results panel that coordinates all visualizations."""
 
+from dataclasses import replace
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QTabWidget
 
+from simulation.results import ScenarioResult
 from widgets.canvas import GraphWidget
 from widgets.results.summary_table import SummaryTableWidget
 from widgets.results.plots import (
@@ -17,6 +20,10 @@ from widgets.results.plots import (
     plot_gdd,
     plot_weather,
 )
+from widgets.results.plots.base import add_tonne_columns
+
+# Plots that depend on the yield gap factor
+_YIELD_GAP_PLOTS = ("yield_gap",)
 
 
 class ResultsPanel(QWidget):
@@ -24,7 +31,7 @@ class ResultsPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.results: List[Dict] = []
+        self.results: List[ScenarioResult] = []
         self.dataframes: Dict[str, pd.DataFrame] = {}
         self.yield_gap_factor: float = 0.35
         self.crop_name: str = "barley"
@@ -32,6 +39,10 @@ class ResultsPanel(QWidget):
         self.weather_df: Optional[pd.DataFrame] = None
         self.weather_year: Optional[int] = None
 
+        # Plots are rendered when their tab is shown; keys still to render
+        self._ctx: Optional[PlotContext] = None
+        self._dirty = set()
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -51,6 +62,16 @@ class ResultsPanel(QWidget):
             "weather": GraphWidget("Figure 7: Weather Patterns"),
         }
 
+        self._plotters = {
+            "n_response": plot_nitrogen_response,
+            "growth": plot_growth_dynamics,
+            "crop": plot_crop_growth,
+            "multiyear": plot_multiyear_analysis,
+            "yield_gap": plot_yield_gap,
+            "gdd": plot_gdd,
+            "weather": plot_weather,
+        }
+
         # Add tabs
         self.tabs.addTab(self.graph_widgets["n_response"], "N Response")
         self.tabs.addTab(self.graph_widgets["growth"], "Growth Dynamics")
@@ -60,6 +81,7 @@ class ResultsPanel(QWidget):
         self.tabs.addTab(self.graph_widgets["gdd"], "GDD")
         self.tabs.addTab(self.graph_widgets["weather"], "Weather")
 
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         layout.addWidget(self.tabs)
 
         # Results summary table
@@ -68,15 +90,20 @@ class ResultsPanel(QWidget):
 
     def update_results(
         self,
-        results: List[Dict],
+        results: List[ScenarioResult],
         dataframes: Dict[str, pd.DataFrame],
         yield_gap_factor: float = 0.35,
         crop_name: str = "barley",
         location_name: str = "",
         weather_df: Optional[pd.DataFrame] = None,
         weather_year: Optional[int] = None,
+        arrays: Optional[Dict[str, np.ndarray]] = None,
     ):
-        """Update all visualizations with new simulation results."""
+        """Update all visualizations with new simulation results.
+
+        arrays holds the per-scenario summary columns (see result_arrays);
+        they are built from results when not given.
+        """
         self.results = results
         self.dataframes = dataframes
         self.yield_gap_factor = yield_gap_factor
@@ -88,6 +115,10 @@ class ResultsPanel(QWidget):
         if not results:
             return
 
+        # Unit conversions shared by several plots, done once per run
+        for df in dataframes.values():
+            add_tonne_columns(df)
+
         # Context object passed to all plot functions
         ctx = PlotContext(
             results=results,
@@ -97,16 +128,41 @@ class ResultsPanel(QWidget):
             location_name=location_name,
             weather_df=weather_df,
             weather_year=weather_year,
+            arrays=arrays,
         )
 
-        # Render all plots
-        plot_nitrogen_response(self.graph_widgets["n_response"], ctx)
-        plot_growth_dynamics(self.graph_widgets["growth"], ctx)
-        plot_crop_growth(self.graph_widgets["crop"], ctx)
-        plot_multiyear_analysis(self.graph_widgets["multiyear"], ctx)
-        plot_yield_gap(self.graph_widgets["yield_gap"], ctx)
-        plot_gdd(self.graph_widgets["gdd"], ctx)
-        plot_weather(self.graph_widgets["weather"], ctx)
+        # Render the visible plot now, the others when their tab is shown
+        self._ctx = ctx
+        self._dirty = set(self.graph_widgets)
+        self._on_tab_changed(self.tabs.currentIndex())
 
         # Update summary table
-        self.summary_table.update_data(results, yield_gap_factor)
+        self.summary_table.update_data(ctx.arrays, yield_gap_factor)
+
+    def set_yield_gap_factor(self, yield_gap_factor: float):
+        """Apply a new yield gap factor to the current results.
+
+        The simulation output is unchanged, so only the yield gap plot and
+        the summary table are redrawn.
+        """
+        self.yield_gap_factor = yield_gap_factor
+        if self._ctx is None or yield_gap_factor == self._ctx.yield_gap_factor:
+            return
+        self._ctx = replace(self._ctx, yield_gap_factor=yield_gap_factor)
+        self._dirty.update(_YIELD_GAP_PLOTS)
+        self._on_tab_changed(self.tabs.currentIndex())
+        self.summary_table.update_data(self._ctx.arrays, yield_gap_factor)
+
+    def _on_tab_changed(self, index: int):
+        """Render the plot for the tab at index if it is out of date."""
+        widget = self.tabs.widget(index)
+        for key, graph_widget in self.graph_widgets.items():
+            if graph_widget is widget:
+                if key in self._dirty and self._ctx is not None:
+                    self._dirty.discard(key)
+                    signature = self._ctx.signature()
+                    if graph_widget.signature != signature:
+                        self._plotters[key](graph_widget, self._ctx)
+                        graph_widget.signature = signature
+                        graph_widget.context = self._ctx
+                return
@@ -1,48 +1,307 @@
 """Shared plotting utilities and data structures."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib import colormaps
+
+from simulation.results import ScenarioResult, result_arrays
 
 
 @dataclass
 class PlotContext:
     """Data context passed to all plotting functions."""
 
-    results: List[Dict]
+    results: List[ScenarioResult]
     dataframes: Dict[str, pd.DataFrame]
     yield_gap_factor: float
     crop_name: str
     location_name: str
     weather_df: Optional[pd.DataFrame]
     weather_year: Optional[int]
+    # Per-scenario summary columns; built from results when not supplied
+    arrays: Optional[Dict[str, np.ndarray]] = None
+    _yield_gap: Optional[Dict[str, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _weather_stats: Optional[Dict[str, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _detail_scenario: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.arrays is None:
+            self.arrays = result_arrays(self.results)
+
+    def signature(self):
+        """Return a cheap key that changes whenever the plotted inputs do."""
+        return (
+            self.crop_name,
+            self.location_name,
+            self.yield_gap_factor,
+            id(self.results),
+            id(self.dataframes),
+            id(self.weather_df),
+            self.weather_year,
+        )
+
+    def get_yield_gap(self) -> Dict[str, np.ndarray]:
+        """Return actual yield and yield gap arrays (t/ha), built once."""
+        if self._yield_gap is None:
+            yield_t = self.arrays["yield_t"]
+            actual = yield_t * self.yield_gap_factor
+            self._yield_gap = {"actual": actual, "gap": yield_t - actual}
+        return self._yield_gap
+
+    def get_detail_scenario(self) -> Optional[str]:
+        """Return the scenario shown in detail: the recommended one, else the last."""
+        if self._detail_scenario is None and self.dataframes:
+            names = list(self.dataframes)
+            self._detail_scenario = next(
+                (name for name in names if "recommended" in name.lower()), names[-1]
+            )
+        return self._detail_scenario
+
+    def get_weather_stats(self) -> Dict[str, float]:
+        """Return season rain totals and annual summaries, built once."""
+        if self._weather_stats is None:
+            self._weather_stats = self._build_weather_stats()
+        return self._weather_stats
+
+    def _build_weather_stats(self) -> Dict[str, float]:
+        df = self.weather_df
+        year = self.weather_year
+        index = df.index.to_numpy()
+        rain = df["rain"].to_numpy(dtype=np.float64)
+
+        def season_total(start, end):
+            # Inclusive date range on the sorted index, as .loc slicing
+            i0 = np.searchsorted(index, np.datetime64(f"{year}-{start}"), "left")
+            i1 = np.searchsorted(index, np.datetime64(f"{year}-{end}"), "right")
+            return float(rain[i0:i1].sum())
+
+        return {
+            "long_rain": season_total("03-01", "05-31"),
+            "short_rain": season_total("10-01", "12-15"),
+            "annual_rain": float(rain.sum()),
+            "tmin_mean": float(df["tmin"].to_numpy(dtype=np.float64).mean()),
+            "tmax_mean": float(df["tmax"].to_numpy(dtype=np.float64).mean()),
+        }
+
+
+class ReusablePlot:
+    """Plot that keeps its axes and artists between renders.
+
+    The first render, and any render whose layout_key() differs from the
+    previous one, clears the figure and calls build(). Otherwise update()
+    only swaps the artists' data. If the plot names its dynamic_artists()
+    and the axis limits and canvas size are unchanged, those artists are
+    blitted over a cached background instead of redrawing the figure.
+    """
 
-    def get_results_df(self) -> pd.DataFrame:
-        """Convert results list to DataFrame."""
-        return pd.DataFrame(
-            [
-                {
-                    "scenario": r["scenario"],
-                    "n_rate": r["n_rate"],
-                    "yield_t": r["yield_t"],
-                    "tagp": r.get("tagp", 0) / 1000,
-                    "laimax": r.get("laimax", 0),
-                }
-                for r in self.results
-            ]
+    def __init__(self):
+        self._layout_key = None
+        self._background = None
+        self._background_state = None
+        self.axes = []
+        self.lines = {}
+        self.fills = {}
+
+    @classmethod
+    def for_widget(cls, graph_widget) -> "ReusablePlot":
+        """Return the plot instance attached to graph_widget, creating it."""
+        if not isinstance(graph_widget.plot, cls):
+            graph_widget.plot = cls()
+        return graph_widget.plot
+
+    def layout_key(self, ctx: "PlotContext"):
+        """Return a key describing the artist layout, or None to never reuse."""
+        return None
+
+    def build(self, fig, ctx: "PlotContext"):
+        raise NotImplementedError
+
+    def update(self, fig, ctx: "PlotContext"):
+        raise NotImplementedError
+
+    def rescale(self):
+        """Refit axis limits to the updated data."""
+        for ax in self.axes:
+            ax.relim()
+            ax.autoscale_view()
+
+    def dynamic_artists(self):
+        """Return every artist update() changes, or None to disable blitting."""
+        return None
+
+    def render(self, graph_widget, ctx: "PlotContext"):
+        canvas = graph_widget.canvas
+        fig = canvas.fig
+        key = self.layout_key(ctx)
+        reusable = (
+            key is not None
+            and key == self._layout_key
+            and self.axes
+            and all(ax in fig.axes for ax in self.axes)
         )
+        if reusable:
+            self.update(fig, ctx)
+            self.rescale()
+            if self._background_state == self._view_state(fig):
+                self._blit(canvas)
+            else:
+                self._draw(canvas)
+            return
+
+        fig.clear()
+        self.axes = []
+        self.lines = {}
+        self.fills = {}
+        self._layout_key = key
+        self.build(fig, ctx)
+        self._draw(canvas)
+
+    def _view_state(self, fig):
+        return (
+            tuple(fig.bbox.bounds),
+            tuple((ax.get_xlim(), ax.get_ylim()) for ax in self.axes),
+        )
+
+    def _draw(self, canvas):
+        """Full draw, capturing the background without the dynamic artists."""
+        artists = self.dynamic_artists()
+        self._background = None
+        self._background_state = None
+        if not artists:
+            # Nothing to blit later, so let Qt coalesce this with other draws
+            canvas.draw_idle()
+            return
+
+        for artist in artists:
+            artist.set_animated(True)
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(canvas.fig.bbox)
+        self._background_state = self._view_state(canvas.fig)
+        for artist in artists:
+            artist.set_animated(False)
+        self._blit(canvas)
+
+    def _blit(self, canvas):
+        canvas.restore_region(self._background)
+        for artist in sorted(self.dynamic_artists(), key=lambda a: a.get_zorder()):
+            canvas.fig.draw_artist(artist)
+        canvas.blit(canvas.fig.bbox)
+
+    def replace_fill(self, name, ax, *args, **kwargs):
+        """Swap a fill_between collection (its vertices can't be mutated)."""
+        old = self.fills.get(name)
+        if old is not None:
+            old.remove()
+        self.fills[name] = ax.fill_between(*args, **kwargs)
+
+
+def reset_axes(fig, nrows: int, ncols: int, **subplot_kw) -> np.ndarray:
+    """Return fig's (nrows, ncols) grid of axes, cleared for redrawing.
+
+    The axes are only recreated when the figure holds a different grid, so
+    repeat renders keep their Axes, spines and tickers and just cla() them.
+    """
+    axes = fig.axes
+    if len(axes) == nrows * ncols and all(
+        ax.get_subplotspec() is not None
+        and ax.get_subplotspec().get_geometry()[:2] == (nrows, ncols)
+        for ax in axes
+    ):
+        for ax in axes:
+            ax.cla()
+        return np.array(axes, dtype=object).reshape(nrows, ncols)
+    fig.clear()
+    return fig.subplots(nrows, ncols, squeeze=False, **subplot_kw)
+
+
+# Candidate output columns, in order of preference, for series whose name
+# varies between PCSE models
+TAGP_COLUMNS = ("TAGP", "tagp", "TAGBM", "WST", "WRT", "WLV")
+TWSO_COLUMNS = ("TWSO", "twso", "WSO", "TWSO_kg")
+N_UPTAKE_COLUMNS = ("NuptakeTotal", "NUPTAKE", "Nuptake")
+
+
+def first_column(columns, candidates) -> Optional[str]:
+    """Return the first of candidates present in columns (ideally a set)."""
+    return next((col for col in candidates if col in columns), None)
+
+
+def add_tonne_columns(df: pd.DataFrame):
+    """Add t/ha copies ("<col>_t") of df's biomass and storage columns.
+
+    Called once per result frame so plots don't divide by 1000 per render.
+    """
+    columns = set(df.columns)
+    for candidates in (TAGP_COLUMNS, TWSO_COLUMNS):
+        col = first_column(columns, candidates)
+        if col and f"{col}_t" not in columns:
+            df[f"{col}_t"] = df[col] / 1000
+
+
+# Upper bound on points per plotted series when the figure width is unknown
+DOWNSAMPLE_TARGET = 2000
+
+
+def downsample_target(fig) -> int:
+    """Return the points-per-series budget for fig: two per pixel column."""
+    return max(2, int(2 * fig.bbox.width))
+
+
+def downsample_index(n: int, target: int = DOWNSAMPLE_TARGET) -> np.ndarray:
+    """Return stride indices selecting at most target of n points.
+
+    The last point is always kept so series still end at their final value,
+    which can add one point over target.
+    """
+    if n <= target:
+        return np.arange(n)
+    # Ceiling stride, so the strided points never exceed target
+    idx = np.arange(0, n, -(-n // target))
+    if idx[-1] != n - 1:
+        idx = np.append(idx, n - 1)
+    return idx
+
+
+def downsample(x, y, target: int = DOWNSAMPLE_TARGET):
+    """Stride-downsample a series for plotting; returns NumPy arrays."""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    idx = downsample_index(len(x), target)
+    return x[idx], y[idx]
+
+
+# Month-name tick labels
+_MONTH_FORMAT = "%b"
 
 
 def format_date_axis(ax):
-    """Apply standard date formatting to axis."""
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%b"))
+    """Apply standard date formatting to axis.
+
+    Formatters and locators are bound to the axis they are set on, so each
+    call makes its own. Plots call this from build(), once per layout.
+    """
+    ax.xaxis.set_major_formatter(mdates.DateFormatter(_MONTH_FORMAT))
     ax.xaxis.set_major_locator(mdates.MonthLocator())
 
 
+@lru_cache(maxsize=16)
+def _cached_colors(n: int) -> np.ndarray:
+    colors = colormaps["viridis"](np.linspace(0.2, 0.8, n))
+    colors.setflags(write=False)
+    return colors
+
+
 def get_scenario_colors(n: int):
-    """Generate consistent colors for n scenarios."""
-    return plt.cm.viridis(np.linspace(0.2, 0.8, n))
+    """Generate consistent colors for n scenarios (read-only, cached per n)."""
+    return _cached_colors(int(n))
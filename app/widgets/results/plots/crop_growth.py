@@ -1,68 +1,72 @@
 """Detailed four-panel crop growth visualization."""
 
-import matplotlib.dates as mdates
+import numpy as np
 
-from widgets.results.plots.base import PlotContext
+from widgets.results.plots.base import (
+    N_UPTAKE_COLUMNS,
+    TAGP_COLUMNS,
+    TWSO_COLUMNS,
+    PlotContext,
+    downsample_index,
+    downsample_target,
+    first_column,
+    format_date_axis,
+    reset_axes,
+)
 
 
 def plot_crop_growth(graph_widget, ctx: PlotContext):
     """Render Figure 3: Detailed four-panel crop growth."""
     fig = graph_widget.canvas.fig
-    fig.clear()
 
     if not ctx.dataframes:
+        fig.clear()
         return
 
     # Use recommended scenario or highest N
-    scenario_name = None
-    for name in ctx.dataframes.keys():
-        if "recommended" in name.lower() or "Recommended" in name:
-            scenario_name = name
-            break
-    if not scenario_name:
-        scenario_name = list(ctx.dataframes.keys())[-1]
+    scenario_name = ctx.get_detail_scenario()
 
     df = ctx.dataframes[scenario_name]
+    df = df.iloc[downsample_index(len(df), downsample_target(fig))]
+    day = df["day"].to_numpy()
+    columns = set(df.columns)
 
-    axes = fig.subplots(2, 2)
+    axes = reset_axes(fig, 2, 2, sharex=True)
 
     # LAI over time
-    if "LAI" in df.columns:
+    if "LAI" in columns:
         axes[0, 0].fill_between(df["day"], 0, df["LAI"], color="green", alpha=0.3)
         axes[0, 0].plot(df["day"], df["LAI"], "g-", linewidth=2)
         axes[0, 0].set_ylabel("LAI (m2/m2)", fontweight="bold")
         axes[0, 0].set_title("(a) Leaf Area Development", fontweight="bold")
 
     # Biomass partitioning
-    tagp_col = next(
-        (c for c in ["TAGP", "tagp", "TAGBM", "WST", "WRT", "WLV"] if c in df.columns),
-        None,
-    )
-    twso_col = next(
-        (c for c in ["TWSO", "twso", "WSO", "TWSO_kg"] if c in df.columns), None
-    )
+    tagp_col = first_column(columns, TAGP_COLUMNS)
+    twso_col = first_column(columns, TWSO_COLUMNS)
 
     if tagp_col:
+        biomass = df[f"{tagp_col}_t"].to_numpy(dtype=np.float64)
         axes[0, 1].fill_between(
-            df["day"],
+            day,
             0,
-            df[tagp_col] / 1000,
+            biomass,
             color="brown",
             alpha=0.3,
             label="Total Biomass",
         )
-        axes[0, 1].plot(df["day"], df[tagp_col] / 1000, "brown", linewidth=2)
+        axes[0, 1].plot(day, biomass, "brown", linewidth=2)
 
         if twso_col:
+            storage = df[f"{twso_col}_t"].to_numpy(dtype=np.float64)
             axes[0, 1].fill_between(
-                df["day"],
+                day,
                 0,
-                df[twso_col] / 1000,
+                storage,
                 color="gold",
                 alpha=0.6,
                 label="Storage Organs",
             )
-            axes[0, 1].plot(df["day"], df[twso_col] / 1000, "gold", linewidth=2)
+            axes[0, 1].plot(day, storage, "gold", linewidth=2)
 
         axes[0, 1].set_ylabel("Biomass (t/ha)", fontweight="bold")
         axes[0, 1].set_title("(b) Biomass Partitioning", fontweight="bold")
@@ -79,25 +83,21 @@ def plot_crop_growth(graph_widget, ctx: PlotContext):
         axes[0, 1].set_title("(b) Biomass Partitioning", fontweight="bold")
 
     # Development stage
-    if "DVS" in df.columns:
+    if "DVS" in columns:
         axes[1, 0].plot(df["day"], df["DVS"], "b-", linewidth=2)
         axes[1, 0].axhline(y=1.0, color="orange", linestyle="--", alpha=0.7)
         axes[1, 0].axhline(y=2.0, color="red", linestyle="--", alpha=0.7)
+        # DVS is monotonic: split into contiguous vegetative (<= 1) and
+        # reproductive (1-2] slices instead of masking with where=
+        dvs = df["DVS"].to_numpy(dtype=np.float64)
+        split = int(np.searchsorted(dvs, 1.0, side="right"))
+        end = int(np.searchsorted(dvs, 2.0, side="right"))
         axes[1, 0].fill_between(
-            df["day"],
-            0,
-            df["DVS"],
-            where=df["DVS"] <= 1,
-            color="lightgreen",
-            alpha=0.3,
+            day[:split], 0, dvs[:split], color="lightgreen", alpha=0.3
         )
+        rep_start = max(split - 1, 0)
         axes[1, 0].fill_between(
-            df["day"],
-            0,
-            df["DVS"],
-            where=(df["DVS"] > 1) & (df["DVS"] <= 2),
-            color="lightyellow",
-            alpha=0.3,
+            day[rep_start:end], 0, dvs[rep_start:end], color="lightyellow", alpha=0.3
         )
         axes[1, 0].set_ylabel("DVS", fontweight="bold")
         axes[1, 0].set_xlabel("Date", fontweight="bold")
@@ -108,20 +108,19 @@ def plot_crop_growth(graph_widget, ctx: PlotContext):
         )
 
     # Nitrogen uptake
-    n_cols = ["NuptakeTotal", "NUPTAKE", "Nuptake"]
+    n_col = first_column(columns, N_UPTAKE_COLUMNS)
     n_found = False
-    for col in n_cols:
-        if col in df.columns:
-            axes[1, 1].plot(df["day"], df[col], "g-", linewidth=2, label="N Uptake")
-            axes[1, 1].fill_between(df["day"], 0, df[col], color="green", alpha=0.2)
-            n_found = True
-            break
-
-    if not n_found and "TAGP" in df.columns:
+    if n_col:
+        n_uptake = df[n_col].to_numpy(dtype=np.float64)
+        axes[1, 1].plot(day, n_uptake, "g-", linewidth=2, label="N Uptake")
+        axes[1, 1].fill_between(day, 0, n_uptake, color="green", alpha=0.2)
+        n_found = True
+
+    if not n_found and "TAGP" in columns:
         # Estimate N uptake from biomass (approx 2% N content)
-        n_uptake = df["TAGP"] * 0.02
-        axes[1, 1].plot(df["day"], n_uptake, "g-", linewidth=2, label="N Uptake (est.)")
-        axes[1, 1].fill_between(df["day"], 0, n_uptake, color="green", alpha=0.2)
+        n_uptake = df["TAGP"].to_numpy(dtype=np.float64) * 0.02
+        axes[1, 1].plot(day, n_uptake, "g-", linewidth=2, label="N Uptake (est.)")
+        axes[1, 1].fill_between(day, 0, n_uptake, color="green", alpha=0.2)
         n_found = True
 
     if n_found:
@@ -139,9 +138,9 @@ def plot_crop_growth(graph_widget, ctx: PlotContext):
         )
         axes[1, 1].set_title("(d) Nitrogen Uptake", fontweight="bold")
 
+    # Shared x-axis: one date locator/formatter serves all four panels
+    format_date_axis(axes[1, 0])
     for ax in axes.flat:
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%b"))
-        ax.xaxis.set_major_locator(mdates.MonthLocator())
         ax.grid(True, alpha=0.3)
 
     fig.suptitle(
@@ -150,5 +149,4 @@ def plot_crop_growth(graph_widget, ctx: PlotContext):
         fontweight="bold",
     )
 
-    fig.tight_layout(rect=[0, 0, 1, 0.95])
-    graph_widget.canvas.draw()
+    graph_widget.canvas.draw_idle()
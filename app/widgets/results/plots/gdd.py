@@ -2,35 +2,33 @@
 
 import numpy as np
 import pandas as pd
-import matplotlib.dates as mdates
+from matplotlib.patches import Rectangle
 
-from widgets.results.plots.base import PlotContext
-from config.crops import PHENOPHASES
+from widgets.results.plots.base import PlotContext, ReusablePlot, format_date_axis
+from config.crops import PHENOPHASES, PHENOPHASES_NP
 
+# DVS marker specs: (name, DVS value, annotation text, color, text offset)
+DVS_MARKERS = (
+    ("flowering", 1.0, "Flowering\n(DVS=1.0)", "orange", (10, 20)),
+    ("maturity", 2.0, "Maturity\n(DVS=2.0)", "red", (10, -30)),
+)
 
-def plot_gdd(graph_widget, ctx: PlotContext):
-    """Render Figure 6: Growing Degree Days with phenophases."""
-    fig = graph_widget.canvas.fig
-    fig.clear()
-
-    if not ctx.dataframes:
-        return
 
+def _prepare(ctx: PlotContext):
+    """Compute the GDD series, phase bands and DVS marker indices."""
     # Get one scenario for GDD display
-    scenario_name = list(ctx.dataframes.keys())[-1]
-    df = ctx.dataframes[scenario_name]
-
-    ax = fig.add_subplot(111)
+    result = ctx.results[-1]
+    df = result.df
 
     # Get crop phenophases or use default
-    crop_info = PHENOPHASES.get(ctx.crop_name, PHENOPHASES["barley"])
+    crop_key = ctx.crop_name if ctx.crop_name in PHENOPHASES else "barley"
+    crop_info = PHENOPHASES[crop_key]
     total_gdd = crop_info["total_gdd"]
-    phases = crop_info["phases"]
 
     # Use calculated GDD from weather data
-    if "GDD" in df.columns:
-        gdd = df["GDD"]
-        total_gdd = gdd.iloc[-1]  # Use actual accumulated GDD
+    if ctx.weather_df is not None and "daily_GDD" in ctx.weather_df.columns:
+        gdd = result.gdd(ctx.weather_df)[1]
+        total_gdd = float(gdd[-1])  # Use actual accumulated GDD
     else:
         # Fallback: estimate from DVS
         if "DVS" in df.columns:
@@ -38,100 +36,206 @@ def plot_gdd(graph_widget, ctx: PlotContext):
         else:
             gdd = np.linspace(0, total_gdd, len(df))
 
-    # Plot GDD accumulation
-    ax.plot(df["day"], gdd, "b-", linewidth=2.5, label="Accumulated GDD")
-    ax.fill_between(df["day"], 0, gdd, alpha=0.1, color="blue")
+    # Phase bands reached during the season. GDD is cumulative, so one
+    # bisection per boundary counts the days in each band.
+    phases_np = PHENOPHASES_NP[crop_key]
+    bounds = np.column_stack([phases_np["starts"], phases_np["ends"]])
+    bounds = bounds.astype(np.float64) * total_gdd
+    gdd_arr = np.asarray(gdd, dtype=np.float64)
+    first = np.searchsorted(gdd_arr, bounds[:, 0], side="left")
+    last = np.searchsorted(gdd_arr, bounds[:, 1], side="right")
+
+    # DVS marker positions (maturity only once it is nearly reached)
+    markers = {}
+    if "DVS" in df.columns:
+        dvs = df["DVS"].to_numpy(dtype=np.float64)
+        markers["flowering"] = int(np.nanargmin(np.abs(dvs - 1.0)))
+        if np.nanmax(dvs) >= 1.95:
+            markers["maturity"] = int(np.nanargmin(np.abs(dvs - 2.0)))
+
+    return {
+        "crop_key": crop_key,
+        "crop_info": crop_info,
+        "day": df["day"],
+        "day_arr": df["day"].to_numpy(),
+        "gdd_arr": gdd_arr,
+        "total_gdd": total_gdd,
+        "bounds": bounds,
+        "visible": last > first,
+        "markers": markers,
+    }
+
+
+def _title(data):
+    return (
+        f'{data["crop_info"]["name"]} - Growing Degree Days & Phenophases\n'
+        f'(Base temp: 0C, Total: {data["total_gdd"]:.0f} GDD)'
+    )
 
-    # Add phenophase bands
-    y_max = total_gdd * 1.1
-    for phase_name, start_frac, end_frac, color in phases:
-        start_gdd = start_frac * total_gdd
-        end_gdd = end_frac * total_gdd
 
-        # Find corresponding days
-        mask = (gdd >= start_gdd) & (gdd <= end_gdd)
-        if mask.any():
-            ax.axhspan(start_gdd, end_gdd, alpha=0.25, color=color, label=phase_name)
+def _info_text(data):
+    return (
+        f'Total GDD: {data["total_gdd"]:.0f}C-d\n'
+        f'Phases: {len(data["crop_info"]["phases"])}'
+    )
+
+
+class GddPlot(ReusablePlot):
+    """Figure 6: accumulated GDD with phenophase bands and DVS markers.
+
+    Re-runs that reach the same phases and markers only move the existing
+    artists.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._prepared = None
+        self.bands = []
+        self.markers = {}
+        self.texts = {}
+
+    def _data_for(self, ctx: PlotContext):
+        if self._prepared is None or self._prepared[0] is not ctx:
+            self._prepared = (ctx, _prepare(ctx))
+        return self._prepared[1]
+
+    def layout_key(self, ctx: PlotContext):
+        if not ctx.dataframes:
+            return None
+        data = self._data_for(ctx)
+        return (
+            data["crop_key"],
+            tuple(data["visible"]),
+            tuple(data["markers"]),
+        )
+
+    def build(self, fig, ctx: PlotContext):
+        self.bands = []
+        self.markers = {}
+        self.texts = {}
+
+        if not ctx.dataframes:
+            return
+
+        data = self._data_for(ctx)
+        day, gdd_arr = data["day"], data["gdd_arr"]
+        phases = data["crop_info"]["phases"]
+
+        ax = fig.add_subplot(111)
+        self.axes = [ax]
+
+        # Plot GDD accumulation
+        (self.lines["gdd"],) = ax.plot(
+            day, gdd_arr, "b-", linewidth=2.5, label="Accumulated GDD"
+        )
+        self.replace_fill("gdd", ax, day, 0, gdd_arr, alpha=0.1, color="blue")
+
+        # Phase bands as axes-wide rectangles so they can be moved in place
+        label_x = day.iloc[0] + pd.Timedelta(days=5)
+        for (phase_name, _, _, color), (start_gdd, end_gdd), visible in zip(
+            phases, data["bounds"], data["visible"]
+        ):
+            if not visible:
+                continue
+            band = Rectangle(
+                (0, start_gdd),
+                1,
+                end_gdd - start_gdd,
+                transform=ax.get_yaxis_transform(),
+                alpha=0.25,
+                color=color,
+                label=phase_name,
+            )
+            ax.add_patch(band)
 
             # Add phase label
-            mid_gdd = (start_gdd + end_gdd) / 2
-            ax.text(
-                df["day"].iloc[0] + pd.Timedelta(days=5),
-                mid_gdd,
+            label = ax.text(
+                label_x,
+                (start_gdd + end_gdd) / 2,
                 phase_name,
                 fontsize=8,
                 fontweight="bold",
                 va="center",
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.7),
             )
-
-    # Add DVS markers
-    if "DVS" in df.columns:
-        # Flowering (DVS = 1.0)
-        flowering_idx = (df["DVS"] - 1.0).abs().idxmin()
-        if flowering_idx is not None:
-            ax.axvline(
-                x=df.loc[flowering_idx, "day"],
-                color="orange",
-                linestyle="--",
-                linewidth=2,
-                alpha=0.8,
-            )
-            ax.annotate(
-                "Flowering\n(DVS=1.0)",
-                xy=(df.loc[flowering_idx, "day"], gdd.iloc[flowering_idx]),
-                xytext=(10, 20),
-                textcoords="offset points",
-                fontsize=9,
-                fontweight="bold",
-                arrowprops=dict(arrowstyle="->", color="orange"),
+            self.bands.append((band, label))
+
+        # Add DVS markers
+        day_arr = data["day_arr"]
+        for name, _, text, color, offset in DVS_MARKERS:
+            i = data["markers"].get(name)
+            if i is None:
+                continue
+            vline = ax.axvline(
+                x=day_arr[i], color=color, linestyle="--", linewidth=2, alpha=0.8
             )
-
-        # Maturity (DVS = 2.0)
-        if df["DVS"].max() >= 1.95:
-            maturity_idx = (df["DVS"] - 2.0).abs().idxmin()
-            ax.axvline(
-                x=df.loc[maturity_idx, "day"],
-                color="red",
-                linestyle="--",
-                linewidth=2,
-                alpha=0.8,
-            )
-            ax.annotate(
-                "Maturity\n(DVS=2.0)",
-                xy=(df.loc[maturity_idx, "day"], gdd.iloc[maturity_idx]),
-                xytext=(10, -30),
+            annotation = ax.annotate(
+                text,
+                xy=(day_arr[i], gdd_arr[i]),
+                xytext=offset,
                 textcoords="offset points",
                 fontsize=9,
                 fontweight="bold",
-                arrowprops=dict(arrowstyle="->", color="red"),
+                arrowprops=dict(arrowstyle="->", color=color),
             )
+            self.markers[name] = (vline, annotation)
+
+        ax.set_xlabel("Date", fontweight="bold")
+        ax.set_ylabel("Growing Degree Days (C-day)", fontweight="bold")
+        self.texts["title"] = ax.set_title(
+            _title(data), fontweight="bold", fontsize=11
+        )
+        ax.set_ylim(0, data["total_gdd"] * 1.1)
+        format_date_axis(ax)
+        ax.grid(True, alpha=0.3)
+
+        # Add GDD info box
+        self.texts["info"] = ax.text(
+            0.98,
+            0.02,
+            _info_text(data),
+            transform=ax.transAxes,
+            ha="right",
+            va="bottom",
+            fontsize=9,
+            bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5),
+        )
+
+    def dynamic_artists(self):
+        return [
+            *self.lines.values(),
+            *self.fills.values(),
+            *(artist for band in self.bands for artist in band),
+            *(artist for marker in self.markers.values() for artist in marker),
+            *self.texts.values(),
+        ]
+
+    def update(self, fig, ctx: PlotContext):
+        data = self._data_for(ctx)
+        day, gdd_arr = data["day"], data["gdd_arr"]
+        ax = self.axes[0]
+
+        self.lines["gdd"].set_data(day, gdd_arr)
+        self.replace_fill("gdd", ax, day, 0, gdd_arr, alpha=0.1, color="blue")
+
+        label_x = day.iloc[0] + pd.Timedelta(days=5)
+        visible_bounds = data["bounds"][data["visible"]]
+        for (band, label), (start_gdd, end_gdd) in zip(self.bands, visible_bounds):
+            band.set_y(start_gdd)
+            band.set_height(end_gdd - start_gdd)
+            label.set_position((label_x, (start_gdd + end_gdd) / 2))
+
+        day_arr = data["day_arr"]
+        for name, (vline, annotation) in self.markers.items():
+            i = data["markers"][name]
+            vline.set_xdata([day_arr[i], day_arr[i]])
+            annotation.xy = (day_arr[i], gdd_arr[i])
+
+        self.texts["title"].set_text(_title(data))
+        self.texts["info"].set_text(_info_text(data))
+        ax.set_ylim(0, data["total_gdd"] * 1.1)
 
-    ax.set_xlabel("Date", fontweight="bold")
-    ax.set_ylabel("Growing Degree Days (C-day)", fontweight="bold")
-    ax.set_title(
-        f'{crop_info["name"]} - Growing Degree Days & Phenophases\n'
-        f"(Base temp: 0C, Total: {total_gdd:.0f} GDD)",
-        fontweight="bold",
-        fontsize=11,
-    )
-    ax.set_ylim(0, y_max)
-    ax.xaxis.set_major_formatter(mdates.DateFormatter("%b"))
-    ax.xaxis.set_major_locator(mdates.MonthLocator())
-    ax.grid(True, alpha=0.3)
-
-    # Add GDD info box
-    info_text = f"Total GDD: {total_gdd:.0f}C-d\nPhases: {len(phases)}"
-    ax.text(
-        0.98,
-        0.02,
-        info_text,
-        transform=ax.transAxes,
-        ha="right",
-        va="bottom",
-        fontsize=9,
-        bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5),
-    )
 
-    fig.tight_layout()
-    graph_widget.canvas.draw()
+def plot_gdd(graph_widget, ctx: PlotContext):
+    """Render Figure 6: Growing Degree Days with phenophases."""
+    GddPlot.for_widget(graph_widget).render(graph_widget, ctx)
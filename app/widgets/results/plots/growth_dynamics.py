@@ -1,80 +1,148 @@
 """Growth dynamics comparison visualization."""
 
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
-
-from widgets.results.plots.base import PlotContext, get_scenario_colors
-
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+from widgets.results.plots.base import (
+    PlotContext,
+    ReusablePlot,
+    TWSO_COLUMNS,
+    downsample,
+    downsample_target,
+    first_column,
+    format_date_axis,
+    get_scenario_colors,
+)
+
+PANELS = [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+
+def _twso_column(ctx: PlotContext):
+    """Resolve the storage-organ column once; all scenarios share a model."""
+    first = next(iter(ctx.dataframes.values()), None)
+    return None if first is None else first_column(set(first.columns), TWSO_COLUMNS)
+
+
+def _series(df, twso_col):
+    """Yield (panel, column) for each series plotted from df, in t/ha."""
+    columns = set(df.columns)
+    if "LAI" in columns:
+        yield (0, 0), "LAI"
+    if "TAGP" in columns:
+        yield (0, 1), "TAGP_t"
+    if twso_col in columns:
+        yield (1, 0), f"{twso_col}_t"
+    if "DVS" in columns:
+        yield (1, 1), "DVS"
+
+
+def _panel_segments(ctx: PlotContext, target: int):
+    """Return {panel: (segments, colors)} with one segment per scenario.
+
+    Series longer than target points are downsampled.
+    """
+    colors = get_scenario_colors(len(ctx.dataframes))
+    panels = {panel: ([], []) for panel in PANELS}
+    twso_col = _twso_column(ctx)
+    for (name, df), c in zip(ctx.dataframes.items(), colors):
+        days = mdates.date2num(df["day"].to_numpy())
+        for panel, col in _series(df, twso_col):
+            x, y = downsample(days, df[col].to_numpy(dtype=np.float64), target)
+            panels[panel][0].append(np.column_stack([x, y]))
+            panels[panel][1].append(c)
+    return panels
+
+
+class GrowthDynamicsPlot(ReusablePlot):
+    """Figure 2: one LineCollection per panel, one segment per scenario."""
+
+    def layout_key(self, ctx: PlotContext):
+        twso_col = _twso_column(ctx)
+        return (
+            ctx.crop_name,
+            tuple(
+                (name, tuple(col for _, col in _series(df, twso_col)))
+                for name, df in ctx.dataframes.items()
+            ),
+        )
 
-def plot_growth_dynamics(graph_widget, ctx: PlotContext):
-    """Render Figure 2: Growth dynamics comparison."""
-    fig = graph_widget.canvas.fig
-    fig.clear()
+    def build(self, fig, ctx: PlotContext):
+        if not ctx.dataframes:
+            return
+
+        axes = fig.subplots(2, 2, sharex=True)
+        self.axes = list(axes.flat)
+
+        panel_segments = _panel_segments(ctx, downsample_target(fig))
+        for panel, (segments, colors) in panel_segments.items():
+            collection = LineCollection(segments, colors=colors, linewidths=2)
+            axes[panel].add_collection(collection)
+            axes[panel].autoscale_view()
+            self.lines[panel] = collection
+
+        # Legend proxies: one handle per scenario instead of per line
+        colors = get_scenario_colors(len(ctx.dataframes))
+        handles = [
+            Line2D([], [], color=c, linewidth=2, label=name)
+            for name, c in zip(ctx.dataframes.keys(), colors)
+        ]
+
+        # Format axes
+        axes[0, 0].set_ylabel("LAI (m2/m2)", fontweight="bold")
+        axes[0, 0].set_title("(a) Leaf Area Index", fontweight="bold", fontsize=10)
+        axes[0, 0].legend(handles=handles, loc="upper right", fontsize=7)
+
+        axes[0, 1].set_ylabel("Total Biomass (t/ha)", fontweight="bold")
+        axes[0, 1].set_title("(b) Above-ground Biomass", fontweight="bold", fontsize=10)
+
+        axes[1, 0].set_ylabel("Yield (t/ha)", fontweight="bold")
+        axes[1, 0].set_xlabel("Date", fontweight="bold")
+        axes[1, 0].set_title("(c) Yield Accumulation", fontweight="bold", fontsize=10)
+
+        axes[1, 1].set_ylabel("DVS", fontweight="bold")
+        axes[1, 1].set_xlabel("Date", fontweight="bold")
+        axes[1, 1].set_title("(d) Development Stage", fontweight="bold", fontsize=10)
+        flowering = axes[1, 1].axhline(
+            y=1.0, color="orange", linestyle="--", alpha=0.7, label="Flowering"
+        )
+        maturity = axes[1, 1].axhline(
+            y=2.0, color="red", linestyle="--", alpha=0.7, label="Maturity"
+        )
+        axes[1, 1].legend(
+            handles=handles + [flowering, maturity], loc="upper left", fontsize=7
+        )
 
-    if not ctx.dataframes:
-        return
+        # Shared x-axis: one date locator/formatter serves all four panels
+        format_date_axis(axes[1, 0])
+        for ax in axes.flat:
+            ax.grid(True, alpha=0.3)
 
-    axes = fig.subplots(2, 2)
+        fig.suptitle(
+            f"{ctx.crop_name.upper()} Growth Under Different N Scenarios",
+            fontsize=11,
+            fontweight="bold",
+        )
 
-    colors = get_scenario_colors(len(ctx.dataframes))
-    color_map = dict(zip(ctx.dataframes.keys(), colors))
+    def update(self, fig, ctx: PlotContext):
+        panel_segments = _panel_segments(ctx, downsample_target(fig))
+        for panel, (segments, _) in panel_segments.items():
+            self.lines[panel].set_segments(segments)
 
-    for name, df in ctx.dataframes.items():
-        c = color_map[name]
+    def dynamic_artists(self):
+        return list(self.lines.values())
 
-        # LAI
-        if "LAI" in df.columns:
-            axes[0, 0].plot(df["day"], df["LAI"], color=c, linewidth=2, label=name)
+    def rescale(self):
+        # relim() ignores collections, so feed the segment extents directly
+        for ax, panel in zip(self.axes, PANELS):
+            ax.relim()
+            segments = self.lines[panel].get_segments()
+            if segments:
+                ax.update_datalim(np.concatenate(segments))
+            ax.autoscale_view()
 
-        # Biomass
-        if "TAGP" in df.columns:
-            axes[0, 1].plot(
-                df["day"], df["TAGP"] / 1000, color=c, linewidth=2, label=name
-            )
 
-        # Yield component
-        twso_col = next(
-            (col for col in ["TWSO", "twso", "WSO", "TWSO_kg"] if col in df.columns),
-            None,
-        )
-        if twso_col:
-            axes[1, 0].plot(
-                df["day"], df[twso_col] / 1000, color=c, linewidth=2, label=name
-            )
-
-        # DVS
-        if "DVS" in df.columns:
-            axes[1, 1].plot(df["day"], df["DVS"], color=c, linewidth=2, label=name)
-
-    # Format axes
-    axes[0, 0].set_ylabel("LAI (m2/m2)", fontweight="bold")
-    axes[0, 0].set_title("(a) Leaf Area Index", fontweight="bold", fontsize=10)
-    axes[0, 0].legend(loc="upper right", fontsize=7)
-
-    axes[0, 1].set_ylabel("Total Biomass (t/ha)", fontweight="bold")
-    axes[0, 1].set_title("(b) Above-ground Biomass", fontweight="bold", fontsize=10)
-
-    axes[1, 0].set_ylabel("Yield (t/ha)", fontweight="bold")
-    axes[1, 0].set_xlabel("Date", fontweight="bold")
-    axes[1, 0].set_title("(c) Yield Accumulation", fontweight="bold", fontsize=10)
-
-    axes[1, 1].set_ylabel("DVS", fontweight="bold")
-    axes[1, 1].set_xlabel("Date", fontweight="bold")
-    axes[1, 1].set_title("(d) Development Stage", fontweight="bold", fontsize=10)
-    axes[1, 1].axhline(y=1.0, color="orange", linestyle="--", alpha=0.7, label="Flowering")
-    axes[1, 1].axhline(y=2.0, color="red", linestyle="--", alpha=0.7, label="Maturity")
-    axes[1, 1].legend(loc="upper left", fontsize=7)
-
-    for ax in axes.flat:
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%b"))
-        ax.xaxis.set_major_locator(mdates.MonthLocator())
-        ax.grid(True, alpha=0.3)
-
-    fig.suptitle(
-        f"{ctx.crop_name.upper()} Growth Under Different N Scenarios",
-        fontsize=11,
-        fontweight="bold",
-    )
-
-    fig.tight_layout(rect=[0, 0, 1, 0.95])
-    graph_widget.canvas.draw()
+def plot_growth_dynamics(graph_widget, ctx: PlotContext):
+    """Render Figure 2: Growth dynamics comparison."""
+    GrowthDynamicsPlot.for_widget(graph_widget).render(graph_widget, ctx)
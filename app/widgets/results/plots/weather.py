@@ -1,140 +1,211 @@
 """Weather patterns visualization."""
 
 import pandas as pd
-import matplotlib.dates as mdates
 
-from widgets.results.plots.base import PlotContext
+from widgets.results.plots.base import PlotContext, ReusablePlot, format_date_axis
 
+# Shared by the temperature and rainfall legends
+_LEGEND_STYLE = dict(loc="upper right", framealpha=0.9, fontsize=8)
 
-def plot_weather(graph_widget, ctx: PlotContext):
-    """Render Figure 7: Weather patterns."""
-    fig = graph_widget.canvas.fig
-    fig.clear()
-
-    if ctx.weather_df is None or len(ctx.weather_df) == 0:
-        ax = fig.add_subplot(111)
-        ax.text(
-            0.5,
-            0.5,
-            "Weather data not available",
-            ha="center",
-            va="center",
-            transform=ax.transAxes,
-            fontsize=12,
+
+def _summary_text(stats):
+    summary_text = f'Annual: {stats["annual_rain"]:.0f}mm rain | '
+    summary_text += f'Temp: {stats["tmin_mean"]:.1f}-{stats["tmax_mean"]:.1f}C'
+    return summary_text
+
+
+def _weather_series(df_weather):
+    """Return the (x, y) arrays to plot.
+
+    The weather frame holds one calendar year of daily values, which is
+    fewer points than the figure is wide, so nothing is downsampled.
+    """
+    x = df_weather.index.to_numpy()
+    tmin = df_weather["tmin"].to_numpy()
+    tmax = df_weather["tmax"].to_numpy()
+    radiation = df_weather["radiation"].to_numpy()
+    return {
+        "range": (x, tmin, tmax),
+        "tmin": (x, tmin),
+        "tmax": (x, tmax),
+        "rain": (x, df_weather["rain"].to_numpy()),
+        "radiation": (x, radiation),
+    }
+
+
+class WeatherPlot(ReusablePlot):
+    """Figure 7: temperature, rainfall and radiation for the weather year."""
+
+    def __init__(self):
+        super().__init__()
+        self.texts = {}
+
+    def layout_key(self, ctx: PlotContext):
+        if ctx.weather_df is None or len(ctx.weather_df) == 0:
+            return None
+        # The weather frame is one daily series, so its span identifies it
+        index = ctx.weather_df.index
+        return (ctx.location_name, ctx.weather_year, len(index), index[0], index[-1])
+
+    def build(self, fig, ctx: PlotContext):
+        self.texts = {}
+
+        if ctx.weather_df is None or len(ctx.weather_df) == 0:
+            ax = fig.add_subplot(111)
+            ax.text(
+                0.5,
+                0.5,
+                "Weather data not available",
+                ha="center",
+                va="center",
+                transform=ax.transAxes,
+                fontsize=12,
+            )
+            return
+
+        df_weather = ctx.weather_df
+        year = ctx.weather_year
+
+        axes = fig.subplots(3, 1, sharex=True)
+        self.axes = list(axes)
+
+        series = _weather_series(df_weather)
+
+        # Temperature
+        self._fill_range(axes[0], series)
+        (self.lines["tmax"],) = axes[0].plot(
+            *series["tmax"], color="#E74C3C", linewidth=0.8, label="Max"
         )
-        graph_widget.canvas.draw()
-        return
-
-    df_weather = ctx.weather_df
-    year = ctx.weather_year
-
-    axes = fig.subplots(3, 1, sharex=True)
-
-    # Temperature
-    axes[0].fill_between(
-        df_weather.index,
-        df_weather["tmin"],
-        df_weather["tmax"],
-        alpha=0.3,
-        color="#E74C3C",
-        label="Daily range",
-    )
-    axes[0].plot(
-        df_weather.index,
-        df_weather["tmax"],
-        color="#E74C3C",
-        linewidth=0.8,
-        label="Max",
-    )
-    axes[0].plot(
-        df_weather.index,
-        df_weather["tmin"],
-        color="#3498DB",
-        linewidth=0.8,
-        label="Min",
-    )
-    axes[0].set_ylabel("Temperature (C)", fontweight="bold")
-    axes[0].legend(loc="upper right", framealpha=0.9, fontsize=8)
-    axes[0].set_ylim(5, 35)
-    axes[0].grid(True, alpha=0.3)
-
-    # Rainfall with season markers
-    axes[1].bar(
-        df_weather.index, df_weather["rain"], width=1, color="#3498DB", alpha=0.7
-    )
-    axes[1].axvspan(
-        f"{year}-03-01",
-        f"{year}-05-31",
-        alpha=0.15,
-        color="green",
-        label="Long Rains (Masika)",
-    )
-    axes[1].axvspan(
-        f"{year}-10-01",
-        f"{year}-12-15",
-        alpha=0.15,
-        color="orange",
-        label="Short Rains (Vuli)",
-    )
-    axes[1].set_ylabel("Rainfall (mm/day)", fontweight="bold")
-    axes[1].legend(loc="upper right", framealpha=0.9, fontsize=8)
-    axes[1].set_ylim(0, 60)
-    axes[1].grid(True, alpha=0.3)
-
-    # Add annotations for total rainfall
-    try:
-        long_rain = df_weather.loc[f"{year}-03-01":f"{year}-05-31", "rain"].sum()
-        short_rain = df_weather.loc[f"{year}-10-01":f"{year}-12-15", "rain"].sum()
-        axes[1].annotate(
-            f"{long_rain:.0f}mm",
-            xy=(pd.Timestamp(f"{year}-04-15"), 55),
-            fontsize=9,
-            ha="center",
-            color="darkgreen",
-            fontweight="bold",
+        (self.lines["tmin"],) = axes[0].plot(
+            *series["tmin"], color="#3498DB", linewidth=0.8, label="Min"
+        )
+        axes[0].set_ylabel("Temperature (C)", fontweight="bold")
+        axes[0].legend(**_LEGEND_STYLE)
+        axes[0].set_ylim(5, 35)
+        axes[0].grid(True, alpha=0.3)
+
+        # Rainfall with season markers, as one stepped fill instead of a
+        # Rectangle patch per day
+        self._fill_rain(axes[1], series)
+        axes[1].axvspan(
+            f"{year}-03-01",
+            f"{year}-05-31",
+            alpha=0.15,
+            color="green",
+            label="Long Rains (Masika)",
         )
-        axes[1].annotate(
-            f"{short_rain:.0f}mm",
-            xy=(pd.Timestamp(f"{year}-11-07"), 55),
-            fontsize=9,
-            ha="center",
-            color="darkorange",
+        axes[1].axvspan(
+            f"{year}-10-01",
+            f"{year}-12-15",
+            alpha=0.15,
+            color="orange",
+            label="Short Rains (Vuli)",
+        )
+        axes[1].set_ylabel("Rainfall (mm/day)", fontweight="bold")
+        axes[1].legend(**_LEGEND_STYLE)
+        axes[1].set_ylim(0, 60)
+        axes[1].grid(True, alpha=0.3)
+
+        # Add annotations for total rainfall
+        try:
+            stats = ctx.get_weather_stats()
+            self.texts["long_rain"] = axes[1].annotate(
+                f"{stats['long_rain']:.0f}mm",
+                xy=(pd.Timestamp(f"{year}-04-15"), 55),
+                fontsize=9,
+                ha="center",
+                color="darkgreen",
+                fontweight="bold",
+            )
+            self.texts["short_rain"] = axes[1].annotate(
+                f"{stats['short_rain']:.0f}mm",
+                xy=(pd.Timestamp(f"{year}-11-07"), 55),
+                fontsize=9,
+                ha="center",
+                color="darkorange",
+                fontweight="bold",
+            )
+        except Exception:
+            pass
+
+        # Radiation
+        (self.lines["radiation"],) = axes[2].plot(
+            *series["radiation"], color="#F39C12", linewidth=0.8
+        )
+        self._fill_radiation(axes[2], series)
+        axes[2].set_ylabel("Solar Radiation\n(MJ/m2/day)", fontweight="bold")
+        axes[2].set_xlabel("Date", fontweight="bold")
+        axes[2].set_ylim(0, 30)
+        axes[2].grid(True, alpha=0.3)
+
+        # Format x-axis (shared, so the bottom axis sets it for all three)
+        format_date_axis(axes[2])
+
+        fig.suptitle(
+            f"Weather Data: {ctx.location_name} ({year})",
+            fontsize=12,
             fontweight="bold",
         )
-    except Exception:
-        pass
-
-    # Radiation
-    axes[2].plot(
-        df_weather.index, df_weather["radiation"], color="#F39C12", linewidth=0.8
-    )
-    axes[2].fill_between(
-        df_weather.index, 0, df_weather["radiation"], alpha=0.3, color="#F39C12"
-    )
-    axes[2].set_ylabel("Solar Radiation\n(MJ/m2/day)", fontweight="bold")
-    axes[2].set_xlabel("Date", fontweight="bold")
-    axes[2].set_ylim(0, 30)
-    axes[2].grid(True, alpha=0.3)
-
-    # Format x-axis
-    axes[2].xaxis.set_major_formatter(mdates.DateFormatter("%b"))
-    axes[2].xaxis.set_major_locator(mdates.MonthLocator())
-
-    fig.suptitle(
-        f"Weather Data: {ctx.location_name} ({year})", fontsize=12, fontweight="bold"
-    )
-
-    # Add summary text
-    try:
-        summary_text = f'Annual: {df_weather["rain"].sum():.0f}mm rain | '
-        summary_text += (
-            f'Temp: {df_weather["tmin"].mean():.1f}-{df_weather["tmax"].mean():.1f}C'
+
+        # Add summary text (as supxlabel so constrained layout reserves room)
+        try:
+            self.texts["summary"] = fig.supxlabel(
+                _summary_text(ctx.get_weather_stats()),
+                fontsize=9,
+                style="italic",
+                color="gray",
+            )
+        except Exception:
+            pass
+
+    def _fill_range(self, ax, series):
+        x, tmin, tmax = series["range"]
+        self.replace_fill(
+            "temp", ax, x, tmin, tmax, alpha=0.3, color="#E74C3C", label="Daily range"
         )
-        fig.text(
-            0.5, 0.01, summary_text, ha="center", fontsize=9, style="italic", color="gray"
+
+    def _fill_rain(self, ax, series):
+        x, rain = series["rain"]
+        self.replace_fill(
+            "rain",
+            ax,
+            x,
+            0,
+            rain,
+            step="mid",
+            color="#3498DB",
+            alpha=0.7,
+            linewidth=0,
         )
-    except Exception:
-        pass
 
-    fig.tight_layout(rect=[0, 0.03, 1, 0.95])
-    graph_widget.canvas.draw()
+    def _fill_radiation(self, ax, series):
+        x, radiation = series["radiation"]
+        self.replace_fill(
+            "radiation", ax, x, 0, radiation, alpha=0.3, color="#F39C12"
+        )
+
+    def dynamic_artists(self):
+        return [*self.lines.values(), *self.fills.values(), *self.texts.values()]
+
+    def update(self, fig, ctx: PlotContext):
+        series = _weather_series(ctx.weather_df)
+        axes = self.axes
+
+        self._fill_range(axes[0], series)
+        self.lines["tmax"].set_data(*series["tmax"])
+        self.lines["tmin"].set_data(*series["tmin"])
+        self._fill_rain(axes[1], series)
+        self.lines["radiation"].set_data(*series["radiation"])
+        self._fill_radiation(axes[2], series)
+
+        stats = ctx.get_weather_stats()
+        if "long_rain" in self.texts:
+            self.texts["long_rain"].set_text(f"{stats['long_rain']:.0f}mm")
+            self.texts["short_rain"].set_text(f"{stats['short_rain']:.0f}mm")
+        if "summary" in self.texts:
+            self.texts["summary"].set_text(_summary_text(stats))
+
+
+def plot_weather(graph_widget, ctx: PlotContext):
+    """Render Figure 7: Weather patterns."""
+    WeatherPlot.for_widget(graph_widget).render(graph_widget, ctx)
@@ -1,107 +1,200 @@
 """Yield gap comparison visualization."""
 
 import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.patches import Patch
 
-from widgets.results.plots.base import PlotContext
+from widgets.results.plots.base import PlotContext, ReusablePlot
 
+_LEGEND_STYLE = dict(loc="upper left", fontsize=9)
 
-def plot_yield_gap(graph_widget, ctx: PlotContext):
-    """Render Figure 5: Yield gap comparison."""
-    fig = graph_widget.canvas.fig
-    fig.clear()
+BAR_WIDTH = 0.35
+ACTUAL_COLOR = to_rgba("#27AE60")
+GAP_COLOR = to_rgba("#E74C3C", 0.7)
 
-    if not ctx.results:
-        return
 
-    df_results = ctx.get_results_df()
+def _actual_label(ctx: PlotContext):
+    return f"Actual Yield ({ctx.yield_gap_factor * 100:.0f}%)"
 
-    ax = fig.add_subplot(111)
 
-    # Calculate actual yields using yield gap factor
-    df_results["actual_yield"] = df_results["yield_t"] * ctx.yield_gap_factor
-    df_results["yield_gap"] = df_results["yield_t"] - df_results["actual_yield"]
+def _factor_text(ctx: PlotContext):
+    return f"Yield Gap Factor: {ctx.yield_gap_factor:.0%}\n(Actual / Potential)"
 
-    x = np.arange(len(df_results))
-    width = 0.35
 
-    # Stacked bar chart
-    ax.bar(
-        x,
-        df_results["actual_yield"],
-        width,
-        label=f"Actual Yield ({ctx.yield_gap_factor * 100:.0f}%)",
-        color="#27AE60",
-    )
-    ax.bar(
-        x,
-        df_results["yield_gap"],
-        width,
-        bottom=df_results["actual_yield"],
-        label="Yield Gap",
-        color="#E74C3C",
-        alpha=0.7,
+def _bar_verts(x, bottom, height, width=BAR_WIDTH):
+    """Return (N, 4, 2) rectangle vertices for bars centred on x."""
+    left = x - width / 2
+    right = x + width / 2
+    top = bottom + height
+    bottom = np.broadcast_to(bottom, x.shape)
+    return np.stack(
+        [
+            np.column_stack([left, bottom]),
+            np.column_stack([left, top]),
+            np.column_stack([right, top]),
+            np.column_stack([right, bottom]),
+        ],
+        axis=1,
     )
 
-    # Potential yield line
-    ax.plot(
-        x,
-        df_results["yield_t"],
-        "ko-",
-        linewidth=2,
-        markersize=8,
-        label="Simulated Potential",
+
+def _stacked_verts(ctx: PlotContext):
+    """Return vertices for all actual bars followed by all gap bars."""
+    yield_gap = ctx.get_yield_gap()
+    actual_yield, gap = yield_gap["actual"], yield_gap["gap"]
+    x = np.arange(len(actual_yield), dtype=np.float64)
+    return np.concatenate(
+        [_bar_verts(x, 0.0, actual_yield), _bar_verts(x, actual_yield, gap)]
     )
 
-    # Labels
-    for i, (actual, gap, total) in enumerate(
-        zip(
-            df_results["actual_yield"],
-            df_results["yield_gap"],
-            df_results["yield_t"],
+
+class YieldGapPlot(ReusablePlot):
+    """Figure 5: stacked actual/gap bars per scenario.
+
+    Both bar layers are one PolyCollection. The axes, ticks and artists are
+    kept while the scenarios stay the same; a new yield gap factor or new
+    results only move vertices and text.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.bars = None
+        self.bar_labels = {}
+        self.texts = {}
+        self.legend = None
+
+    def layout_key(self, ctx: PlotContext):
+        if not ctx.results:
+            return None
+        return (ctx.crop_name, tuple(ctx.arrays["scenario"]))
+
+    def build(self, fig, ctx: PlotContext):
+        self.bars = None
+        self.bar_labels = {}
+        self.texts = {}
+        self.legend = None
+
+        if not ctx.results:
+            return
+
+        ax = fig.add_subplot(111)
+        self.axes = [ax]
+
+        arrays = ctx.arrays
+        n = len(arrays["yield_t"])
+        x = np.arange(n)
+
+        # Stacked bar chart: actual and gap rectangles in one collection
+        self.bars = PolyCollection(
+            _stacked_verts(ctx),
+            facecolors=[ACTUAL_COLOR] * n + [GAP_COLOR] * n,
+            linewidths=0,
         )
-    ):
-        ax.annotate(
-            f"{actual:.1f}",
-            xy=(i, actual / 2),
-            ha="center",
-            va="center",
-            fontsize=8,
+        self.bars.sticky_edges.y.append(0)
+        ax.add_collection(self.bars)
+
+        # Potential yield line
+        (self.lines["potential"],) = ax.plot(
+            x,
+            arrays["yield_t"],
+            "ko-",
+            linewidth=2,
+            markersize=8,
+            label="Simulated Potential",
+        )
+
+        # Labels: actual yield centred in its bar, potential on top of the stack
+        self.bar_labels["actual"] = [
+            ax.annotate(
+                "",
+                xy=(i, 0),
+                ha="center",
+                va="center",
+                fontsize=8,
+                fontweight="bold",
+                color="white",
+            )
+            for i in x
+        ]
+        self.bar_labels["total"] = [
+            ax.annotate(
+                "",
+                xy=(i, 0),
+                xytext=(0, 3),
+                textcoords="offset points",
+                ha="center",
+                va="bottom",
+                fontsize=8,
+                fontweight="bold",
+            )
+            for i in x
+        ]
+        self._place_labels(ctx)
+
+        ax.set_xlabel("Fertilizer Scenario", fontweight="bold")
+        ax.set_ylabel("Yield (t/ha)", fontweight="bold")
+        ax.set_title(
+            f"Yield Gap Analysis - {ctx.crop_name.capitalize()}",
             fontweight="bold",
-            color="white",
+            fontsize=12,
         )
-        ax.annotate(
-            f"{total:.2f}",
-            xy=(i, total + 0.1),
-            ha="center",
+        ax.set_xticks(x)
+        ax.set_xticklabels(arrays["scenario"], rotation=20, ha="right", fontsize=8)
+        # Proxy patches stand in for the two bar layers; update() relabels
+        # the actual-yield entry in place
+        self.legend = ax.legend(
+            handles=[
+                Patch(facecolor=ACTUAL_COLOR, label=_actual_label(ctx)),
+                Patch(facecolor=GAP_COLOR, label="Yield Gap"),
+                self.lines["potential"],
+            ],
+            **_LEGEND_STYLE,
+        )
+        ax.grid(True, axis="y", alpha=0.3)
+
+        # Add annotation explaining yield gap
+        self.texts["factor"] = ax.text(
+            0.98,
+            0.02,
+            _factor_text(ctx),
+            transform=ax.transAxes,
+            ha="right",
             va="bottom",
             fontsize=8,
-            fontweight="bold",
+            style="italic",
+            bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5),
         )
 
-    ax.set_xlabel("Fertilizer Scenario", fontweight="bold")
-    ax.set_ylabel("Yield (t/ha)", fontweight="bold")
-    ax.set_title(
-        f"Yield Gap Analysis - {ctx.crop_name.capitalize()}",
-        fontweight="bold",
-        fontsize=12,
-    )
-    ax.set_xticks(x)
-    ax.set_xticklabels(df_results["scenario"], rotation=20, ha="right", fontsize=8)
-    ax.legend(loc="upper left", fontsize=9)
-    ax.grid(True, axis="y", alpha=0.3)
-
-    # Add annotation explaining yield gap
-    ax.text(
-        0.98,
-        0.02,
-        f"Yield Gap Factor: {ctx.yield_gap_factor:.0%}\n(Actual / Potential)",
-        transform=ax.transAxes,
-        ha="right",
-        va="bottom",
-        fontsize=8,
-        style="italic",
-        bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5),
-    )
+    def _place_labels(self, ctx: PlotContext):
+        actual_yield = ctx.get_yield_gap()["actual"]
+        yield_t = ctx.arrays["yield_t"]
+        for i, (label, actual) in enumerate(
+            zip(self.bar_labels["actual"], actual_yield)
+        ):
+            label.xy = (i, actual / 2)
+            label.set_text(f"{actual:.1f}")
+        for i, (label, total) in enumerate(zip(self.bar_labels["total"], yield_t)):
+            label.xy = (i, total)
+            label.set_text(f"{total:.2f}")
+
+    def update(self, fig, ctx: PlotContext):
+        self.bars.set_verts(_stacked_verts(ctx))
+        self.lines["potential"].set_ydata(ctx.arrays["yield_t"])
+        self._place_labels(ctx)
+        self.legend.get_texts()[0].set_text(_actual_label(ctx))
+        self.texts["factor"].set_text(_factor_text(ctx))
+
+    def rescale(self):
+        # relim() ignores collections, so feed the bar extents directly
+        ax = self.axes[0]
+        ax.relim()
+        verts = [path.vertices for path in self.bars.get_paths()]
+        if verts:
+            ax.update_datalim(np.concatenate(verts))
+        ax.autoscale_view()
 
-    fig.tight_layout()
-    graph_widget.canvas.draw()
+
+def plot_yield_gap(graph_widget, ctx: PlotContext):
+    """Render Figure 5: Yield gap comparison."""
+    YieldGapPlot.for_widget(graph_widget).render(graph_widget, ctx)
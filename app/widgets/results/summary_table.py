@@ -1,43 +1,115 @@
 """Summary table widget for displaying simulation results."""
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict
 
-import pandas as pd
-from PyQt5.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
+import numpy as np
+from PyQt5.QtCore import QPointF, Qt
+from PyQt5.QtGui import QPalette, QStandardItem, QStandardItemModel, QStaticText
+from PyQt5.QtWidgets import (
+    QApplication,
+    QHeaderView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
+)
 
+COLUMNS = [
+    "Scenario",
+    "N Rate (kg/ha)",
+    "Yield (t/ha)",
+    "Actual Yield (t/ha)",
+    "Biomass (t/ha)",
+    "LAI Max",
+]
 
-class SummaryTableWidget(QTableWidget):
-    """Table widget for displaying simulation results summary."""
+
+@lru_cache(maxsize=4096)
+def _static_text(text: str) -> QStaticText:
+    """Return a QStaticText for text; its layout is cached after first paint."""
+    static = QStaticText(text)
+    static.setTextFormat(Qt.PlainText)
+    return static
+
+
+class CachedStaticTextDelegate(QStyledItemDelegate):
+    """Item delegate drawing cell text from cached QStaticText layouts.
+
+    The formatted numbers repeat across rows and repaints, so each distinct
+    string is shaped once instead of on every paint.
+    """
+
+    def paint(self, painter, option, index):
+        text = index.data(Qt.DisplayRole)
+        if not text:
+            super().paint(painter, option, index)
+            return
+
+        # Let the style draw background, selection and focus without text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        static = _static_text(str(text))
+        rect = style.subElementRect(QStyle.SE_ItemViewItemText, opt, opt.widget)
+        role = (
+            QPalette.HighlightedText
+            if opt.state & QStyle.State_Selected
+            else QPalette.Text
+        )
+        painter.save()
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.color(role))
+        y = rect.top() + (rect.height() - static.size().height()) / 2
+        painter.drawStaticText(QPointF(rect.left(), y), static)
+        painter.restore()
+
+
+class SummaryTableWidget(QTableView):
+    """Table view for displaying simulation results summary."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMaximumHeight(150)
+        self.setItemDelegate(CachedStaticTextDelegate(self))
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-    def update_data(self, results: List[Dict], yield_gap_factor: float):
-        """Update the table with simulation results."""
-        if not results:
+    def update_data(self, arrays: Dict[str, np.ndarray], yield_gap_factor: float):
+        """Update the table with per-scenario result arrays."""
+        n = len(arrays["scenario"])
+        if not n:
             return
 
-        df = pd.DataFrame(
+        # Format whole columns at once, then fill cells from an (n, 6) array
+        yield_t = arrays["yield_t"]
+        cells = np.column_stack(
             [
-                {
-                    "Scenario": r["scenario"],
-                    "N Rate (kg/ha)": r["n_rate"],
-                    "Yield (t/ha)": f"{r['yield_t']:.2f}",
-                    "Actual Yield (t/ha)": f"{r['yield_t'] * yield_gap_factor:.2f}",
-                    "Biomass (t/ha)": f"{r['tagp'] / 1000:.2f}",
-                    "LAI Max": f"{r['laimax']:.2f}",
-                }
-                for r in results
+                arrays["scenario"],
+                [f"{v:g}" for v in arrays["n_rate"]],
+                np.char.mod("%.2f", yield_t),
+                np.char.mod("%.2f", yield_t * yield_gap_factor),
+                np.char.mod("%.2f", arrays["tagp"]),
+                np.char.mod("%.2f", arrays["laimax"]),
             ]
-        )
-
-        self.setRowCount(len(df))
-        self.setColumnCount(len(df.columns))
-        self.setHorizontalHeaderLabels(df.columns)
+        ).astype(object)
 
-        for i, row in df.iterrows():
-            for j, val in enumerate(row):
-                self.setItem(i, j, QTableWidgetItem(str(val)))
+        # Populate a detached model, then attach it in one step so the view
+        # lays out and repaints once rather than per cell
+        model = QStandardItemModel(n, len(COLUMNS), self)
+        model.setHorizontalHeaderLabels(COLUMNS)
+        for i, row in enumerate(cells):
+            for j, text in enumerate(row):
+                model.setItem(i, j, QStandardItem(text))
 
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # setModel() creates a new selection model and leaves the old one,
+        # like the old model, to the caller
+        old_model = self.model()
+        old_selection = self.selectionModel()
+        self.setModel(model)
+        if old_selection is not None:
+            old_selection.deleteLater()
+        if old_model is not None:
+            old_model.deleteLater()
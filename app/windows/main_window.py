@@ -1,10 +1,11 @@
 """Main application window."""
 
 from datetime import date
+from functools import partial
 from typing import Dict, List
 
-from PyQt5.QtCore import QDate
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QDate, QThreadPool, Qt
+from PyQt5.QtGui import QFont, QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
     QAction,
     QComboBox,
@@ -20,21 +21,102 @@ from PyQt5.QtWidgets import (
     QProgressBar,
     QPushButton,
     QStatusBar,
+    QToolButton,
     QVBoxLayout,
     QWidget,
 )
 
 from config import (
     CROP_OPTIONS,
-    LOCATION_OPTIONS,
-    SOIL_TYPES,
     DEFAULT_FERT_SCENARIOS,
+    LOCATION_OPTIONS,
+    fresh_defaults,
 )
-from dialogs import SoilSettingsDialog, FertilizerSettingsDialog
-from simulation import SimulationWorker
+import dialogs
+from simulation import SimulationConfig, SimulationWorker, result_arrays
 from widgets import LocationMapWidget
 from widgets.results import ResultsPanel
 
+# Info label texts; the crop and location tables are static, so the
+# strings are formatted once at import
+_CROP_INFO = {
+    crop: (
+        f"Kenya relevance: {config['kenya_relevance']}\n"
+        f"N demand: {config['n_demand']}, Season: {config['season_days']} days"
+    )
+    for crop, config in CROP_OPTIONS.items()
+}
+_LOCATION_INFO = {
+    key: (
+        f"Coordinates: {loc['lat']:.4f}N, {loc['lon']:.4f}E\n"
+        f"Best for: {', '.join(loc['best_for'])}"
+    )
+    for key, loc in LOCATION_OPTIONS.items()
+}
+
+# Default planting date per crop, shown when the crop is selected
+_DEFAULT_PLANTING_DATES = {
+    crop: QDate(2023, config["planting_month"], config["planting_day"])
+    for crop, config in CROP_OPTIONS.items()
+}
+
+# About dialog body
+_ABOUT_HTML = (
+    "<h2>Kenya Digital Farm Twin</h2>"
+    "<p>WOFOST 8.1 Crop Simulation Application</p>"
+    "<p>This application simulates crop growth under nitrogen and water "
+    "limitation for various locations in Kenya.</p>"
+    "<p><b>Model:</b> WOFOST 8.1 NWLP_MLWB_CNB</p>"
+    "<p><b>Features:</b></p>"
+    "<ul>"
+    "<li>Multiple crop types</li>"
+    "<li>Customizable soil parameters</li>"
+    "<li>Fertilizer scenario comparison</li>"
+    "<li>Interactive visualizations</li>"
+    "</ul>"
+)
+
+# Run button style; one string shared by every window
+_RUN_BTN_QSS = """
+QPushButton {
+    background-color: #27AE60;
+    color: white;
+    border-radius: 5px;
+}
+QPushButton:hover {
+    background-color: #2ECC71;
+}
+QPushButton:pressed {
+    background-color: #1E8449;
+}
+QPushButton:disabled {
+    background-color: #95A5A6;
+}
+"""
+
+
+def _fill_combo(combo: QComboBox, labels: Dict[str, str]):
+    """Fill combo with labels (keyed by item data) from a prebuilt model.
+
+    The model is populated detached and attached in one setModel() call,
+    with signals blocked so the initial selection doesn't reach handlers;
+    callers connect currentIndexChanged afterwards.
+    """
+    model = QStandardItemModel(len(labels), 1, combo)
+    for row, (key, label) in enumerate(labels.items()):
+        item = QStandardItem(label)
+        item.setData(key, Qt.UserRole)
+        model.setItem(row, 0, item)
+
+    old_model = combo.model()
+    combo.blockSignals(True)
+    try:
+        combo.setModel(model)
+    finally:
+        combo.blockSignals(False)
+    if old_model is not None:
+        old_model.deleteLater()
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -46,13 +128,31 @@ class MainWindow(QMainWindow):
 
         # Initialize state
         self.current_soil = "nitisol"
-        self.soil_params = SOIL_TYPES["nitisol"].copy()
-        self.fert_scenarios = {k: v.copy() for k, v in DEFAULT_FERT_SCENARIOS.items()}
-
+        # None until a dialog returns edited values: runs then use the
+        # current_soil preset and the default fertilizer scenarios
+        self.soil_params = None
+        self.fert_scenarios = None
+
+        # Incremented per run so signals from a superseded run are ignored
+        self._run_generation = 0
+        # Signal bundle of the running worker, released when it reports back
+        self._worker_signals = None
+        # Inputs of the latest run, for labelling its results
+        self._run_config = None
+
+        self._setup_actions()
         self._setup_ui()
         self._setup_menus()
         self._setup_statusbar()
 
+    def _setup_actions(self):
+        """Create actions shared by the settings buttons and the menu."""
+        self.soil_action = QAction("Soil Parameters...", self)
+        self.soil_action.triggered.connect(self._show_soil_settings)
+
+        self.fert_action = QAction("Fertilizer Scenarios...", self)
+        self.fert_action.triggered.connect(self._show_fert_settings)
+
     def _setup_ui(self):
         """Setup the main UI layout."""
         central_widget = QWidget()
@@ -71,8 +171,8 @@ class MainWindow(QMainWindow):
 
         # Crop dropdown
         self.crop_combo = QComboBox()
-        for crop, config in CROP_OPTIONS.items():
-            self.crop_combo.addItem(f"{crop.capitalize()}", crop)
+        _fill_combo(self.crop_combo, {crop: crop.capitalize() for crop in CROP_OPTIONS})
+        self._current_crop = self.crop_combo.currentData()
         self.crop_combo.currentIndexChanged.connect(self._on_crop_changed)
         crop_layout.addRow("Crop:", self.crop_combo)
 
@@ -109,18 +209,23 @@ class MainWindow(QMainWindow):
         # Location dropdown
         loc_combo_layout = QHBoxLayout()
         self.location_combo = QComboBox()
-        for key, loc in LOCATION_OPTIONS.items():
-            self.location_combo.addItem(loc["name"], key)
+        _fill_combo(
+            self.location_combo,
+            {key: loc["name"] for key, loc in LOCATION_OPTIONS.items()},
+        )
+        self._current_location = LOCATION_OPTIONS[self.location_combo.currentData()]
         self.location_combo.currentIndexChanged.connect(self._on_location_changed)
         loc_combo_layout.addWidget(QLabel("Location:"))
         loc_combo_layout.addWidget(self.location_combo, 1)
         location_layout.addLayout(loc_combo_layout)
 
-        # Map widget
-        self.map_widget = LocationMapWidget()
-        self.map_widget.location_selected.connect(self._on_map_location_selected)
-        self.map_widget.setMinimumHeight(200)
-        location_layout.addWidget(self.map_widget)
+        # Map widget, built on request so its figure isn't drawn at startup
+        self.map_widget = None
+        self._location_layout = location_layout
+        self.show_map_btn = QToolButton()
+        self.show_map_btn.setText("Show map")
+        self.show_map_btn.clicked.connect(self._show_map)
+        location_layout.addWidget(self.show_map_btn)
 
         # Location info
         self.location_info_label = QLabel()
@@ -143,6 +248,7 @@ class MainWindow(QMainWindow):
         self.yield_gap_spin.setToolTip(
             "Ratio of actual farmer yield to simulated potential yield"
         )
+        self.yield_gap_spin.valueChanged.connect(self._on_yield_gap_changed)
         yield_layout.addRow("Factor (0.1-1.0):", self.yield_gap_spin)
 
         yield_info = QLabel(
@@ -157,12 +263,12 @@ class MainWindow(QMainWindow):
         settings_group = QGroupBox("Settings")
         settings_layout = QVBoxLayout(settings_group)
 
-        soil_btn = QPushButton("Soil Parameters...")
-        soil_btn.clicked.connect(self._show_soil_settings)
+        soil_btn = QPushButton(self.soil_action.text())
+        soil_btn.clicked.connect(self.soil_action.trigger)
         settings_layout.addWidget(soil_btn)
 
-        fert_btn = QPushButton("Fertilizer Scenarios...")
-        fert_btn.clicked.connect(self._show_fert_settings)
+        fert_btn = QPushButton(self.fert_action.text())
+        fert_btn.clicked.connect(self.fert_action.trigger)
         settings_layout.addWidget(fert_btn)
 
         left_layout.addWidget(settings_group)
@@ -171,24 +277,7 @@ class MainWindow(QMainWindow):
         self.run_btn = QPushButton("Run Simulation")
         self.run_btn.setMinimumHeight(50)
         self.run_btn.setFont(QFont("Arial", 12, QFont.Bold))
-        self.run_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #27AE60;
-                color: white;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2ECC71;
-            }
-            QPushButton:pressed {
-                background-color: #1E8449;
-            }
-            QPushButton:disabled {
-                background-color: #95A5A6;
-            }
-        """
-        )
+        self.run_btn.setStyleSheet(_RUN_BTN_QSS)
         self.run_btn.clicked.connect(self._run_simulation)
         left_layout.addWidget(self.run_btn)
 
@@ -225,13 +314,8 @@ class MainWindow(QMainWindow):
         # Settings menu
         settings_menu = menubar.addMenu("Settings")
 
-        soil_action = QAction("Soil Parameters...", self)
-        soil_action.triggered.connect(self._show_soil_settings)
-        settings_menu.addAction(soil_action)
-
-        fert_action = QAction("Fertilizer Scenarios...", self)
-        fert_action.triggered.connect(self._show_fert_settings)
-        settings_menu.addAction(fert_action)
+        settings_menu.addAction(self.soil_action)
+        settings_menu.addAction(self.fert_action)
 
         # Help menu
         help_menu = menubar.addMenu("Help")
@@ -248,70 +332,102 @@ class MainWindow(QMainWindow):
 
     def _on_crop_changed(self):
         """Handle crop selection change."""
-        self._update_variety_combo()
-        self._update_crop_info()
-        self._set_default_date()
+        crop = self.crop_combo.currentData()
+        if crop == self._current_crop:
+            return
+        self._current_crop = crop
+
+        # One repaint for the variety, info and date updates together
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        try:
+            self._update_variety_combo()
+            self._update_crop_info()
+            self._set_default_date()
+        finally:
+            central.setUpdatesEnabled(True)
 
     def _update_variety_combo(self):
         """Update variety dropdown based on selected crop."""
-        self.variety_combo.clear()
         crop = self.crop_combo.currentData()
-        if crop in CROP_OPTIONS:
-            variety = CROP_OPTIONS[crop]["variety"]
+        variety = CROP_OPTIONS[crop]["variety"] if crop in CROP_OPTIONS else None
+        # Each crop has a single variety; keep the combo if it already shows it
+        combo = self.variety_combo
+        if combo.count() == 1 and combo.itemData(0) == variety:
+            return
+        self.variety_combo.clear()
+        if variety is not None:
             self.variety_combo.addItem(variety, variety)
 
     def _update_crop_info(self):
         """Update crop information label."""
         crop = self.crop_combo.currentData()
-        if crop in CROP_OPTIONS:
-            config = CROP_OPTIONS[crop]
-            self.crop_info_label.setText(
-                f"Kenya relevance: {config['kenya_relevance']}\n"
-                f"N demand: {config['n_demand']}, Season: {config['season_days']} days"
-            )
+        if crop in _CROP_INFO:
+            self.crop_info_label.setText(_CROP_INFO[crop])
 
     def _set_default_date(self):
         """Set default planting date based on crop."""
-        crop = self.crop_combo.currentData()
-        if crop in CROP_OPTIONS:
-            config = CROP_OPTIONS[crop]
-            default_date = QDate(2023, config["planting_month"], config["planting_day"])
+        default_date = _DEFAULT_PLANTING_DATES.get(self.crop_combo.currentData())
+        if default_date is not None:
             self.date_edit.setDate(default_date)
 
     def _on_location_changed(self):
         """Handle location dropdown change."""
         location_key = self.location_combo.currentData()
-        self.map_widget.set_location(location_key)
+        self._current_location = LOCATION_OPTIONS[location_key]
+        if self.map_widget is not None:
+            self.map_widget.set_location(location_key)
         self._update_location_info()
 
+    def _show_map(self):
+        """Replace the "Show map" button with the location map."""
+        if self.map_widget is not None:
+            return
+        self.map_widget = LocationMapWidget()
+        self.map_widget.set_location(self.location_combo.currentData())
+        self.map_widget.location_selected.connect(self._on_map_location_selected)
+        self.map_widget.setMinimumHeight(200)
+        self._location_layout.replaceWidget(self.show_map_btn, self.map_widget)
+        self.show_map_btn.deleteLater()
+        self.show_map_btn = None
+
     def _on_map_location_selected(self, location_key: str):
         """Handle location selection from map."""
         idx = self.location_combo.findData(location_key)
         if idx >= 0:
-            self.location_combo.setCurrentIndex(idx)
+            # The map already shows the selection; skip _on_location_changed
+            self.location_combo.blockSignals(True)
+            try:
+                self.location_combo.setCurrentIndex(idx)
+            finally:
+                self.location_combo.blockSignals(False)
+            self._current_location = LOCATION_OPTIONS[location_key]
         self._update_location_info()
 
     def _update_location_info(self):
         """Update location information label."""
         location_key = self.location_combo.currentData()
-        if location_key in LOCATION_OPTIONS:
-            loc = LOCATION_OPTIONS[location_key]
-            self.location_info_label.setText(
-                f"Coordinates: {loc['lat']:.4f}N, {loc['lon']:.4f}E\n"
-                f"Best for: {', '.join(loc['best_for'])}"
-            )
+        if location_key in _LOCATION_INFO:
+            self.location_info_label.setText(_LOCATION_INFO[location_key])
+
+    def _on_yield_gap_changed(self, value: float):
+        """Re-render the yield gap views of the current results."""
+        self.results_panel.set_yield_gap_factor(value)
 
     def _show_soil_settings(self):
         """Show soil settings dialog."""
-        dialog = SoilSettingsDialog(self.current_soil, self.soil_params, self)
+        dialog = dialogs.SoilSettingsDialog(self.current_soil, self.soil_params, self)
         if dialog.exec_() == QDialog.Accepted:
-            self.soil_params = dialog.get_soil_params()
             self.current_soil = dialog.get_soil_type()
+            self.soil_params = None if dialog.is_preset() else dialog.get_soil_params()
             self.statusbar.showMessage(f"Soil parameters updated: {self.current_soil}")
 
     def _show_fert_settings(self):
         """Show fertilizer settings dialog."""
-        dialog = FertilizerSettingsDialog(self.fert_scenarios, self)
+        scenarios = self.fert_scenarios
+        if scenarios is None:
+            scenarios = fresh_defaults()
+        dialog = dialogs.FertilizerSettingsDialog(scenarios, self)
         if dialog.exec_() == QDialog.Accepted:
             self.fert_scenarios = dialog.get_scenarios()
             enabled_count = sum(
@@ -323,41 +439,66 @@ class MainWindow(QMainWindow):
 
     def _run_simulation(self):
         """Run the WOFOST simulation."""
+        # One run at a time; the run button is disabled meanwhile anyway
+        if self._worker_signals is not None:
+            return
+
         # Prepare configuration
-        crop_name = self.crop_combo.currentData()
-        location_key = self.location_combo.currentData()
-        location = LOCATION_OPTIONS[location_key]
+        crop_name = self._current_crop
+        location = self._current_location
 
         q_date = self.date_edit.date()
         start_date = date(q_date.year(), q_date.month(), q_date.day())
 
-        config = {
-            "crop": crop_name,
-            "location": location,
-            "soil_params": self.soil_params,
-            "fert_scenarios": self.fert_scenarios,
-            "start_date": start_date,
-        }
+        config = SimulationConfig(
+            crop=crop_name,
+            location=location,
+            soil_type=self.current_soil,
+            soil_params=self.soil_params,
+            fert_scenarios=(
+                DEFAULT_FERT_SCENARIOS
+                if self.fert_scenarios is None
+                else self.fert_scenarios
+            ),
+            start_date=start_date,
+        )
 
         # Disable UI during simulation
         self.run_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        # Create and start worker thread
-        self.worker = SimulationWorker(config)
-        self.worker.progress.connect(self._on_simulation_progress)
-        self.worker.finished.connect(self._on_simulation_finished)
-        self.worker.error.connect(self._on_simulation_error)
-        self.worker.start()
-
-    def _on_simulation_progress(self, value: int, message: str):
+        # Start the worker on the global pool; the pool owns and deletes it
+        self._run_generation += 1
+        generation = self._run_generation
+        worker = SimulationWorker(config)
+        worker.progress.connect(partial(self._on_simulation_progress, generation))
+        worker.finished.connect(partial(self._on_simulation_finished, generation))
+        worker.error.connect(partial(self._on_simulation_error, generation))
+        self._worker_signals = worker.signals
+        self._run_config = config
+        QThreadPool.globalInstance().start(worker)
+
+    def _release_worker(self):
+        """Disconnect and schedule deletion of the finished worker's signals."""
+        signals = self._worker_signals
+        self._worker_signals = None
+        if signals is None:
+            return
+        for signal in (signals.progress, signals.finished, signals.error):
+            signal.disconnect()
+        signals.deleteLater()
+
+    def _on_simulation_progress(self, generation: int, value: int, message: str):
         """Handle simulation progress updates."""
+        if generation != self._run_generation:
+            return
         self.progress_bar.setValue(value)
         self.statusbar.showMessage(message)
 
     def _on_simulation_finished(
         self,
+        generation: int,
         results: List,
         dataframes: Dict,
         weather_df=None,
@@ -365,30 +506,37 @@ class MainWindow(QMainWindow):
         weather_location=None,
     ):
         """Handle simulation completion."""
+        if generation != self._run_generation:
+            return
+        self._release_worker()
         self.run_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
 
         if results:
-            crop_name = self.crop_combo.currentData()
-            location = LOCATION_OPTIONS[self.location_combo.currentData()]
+            # Label results with the run's inputs, not the current selection
+            config = self._run_config
             yield_gap = self.yield_gap_spin.value()
 
             self.results_panel.update_results(
                 results,
                 dataframes,
                 yield_gap,
-                crop_name,
-                location["name"],
+                config.crop,
+                config.location["name"],
                 weather_df,
                 weather_year,
+                result_arrays(results),
             )
             self.statusbar.showMessage(f"Simulation complete: {len(results)} scenarios")
         else:
             QMessageBox.warning(self, "Warning", "No results returned from simulation.")
             self.statusbar.showMessage("Simulation completed with no results")
 
-    def _on_simulation_error(self, error_msg: str):
+    def _on_simulation_error(self, generation: int, error_msg: str):
         """Handle simulation error."""
+        if generation != self._run_generation:
+            return
+        self._release_worker()
         self.run_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
 
@@ -403,19 +551,4 @@ class MainWindow(QMainWindow):
 
     def _show_about(self):
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About Kenya Digital Farm Twin",
-            "<h2>Kenya Digital Farm Twin</h2>"
-            "<p>WOFOST 8.1 Crop Simulation Application</p>"
-            "<p>This application simulates crop growth under nitrogen and water "
-            "limitation for various locations in Kenya.</p>"
-            "<p><b>Model:</b> WOFOST 8.1 NWLP_MLWB_CNB</p>"
-            "<p><b>Features:</b></p>"
-            "<ul>"
-            "<li>Multiple crop types</li>"
-            "<li>Customizable soil parameters</li>"
-            "<li>Fertilizer scenario comparison</li>"
-            "<li>Interactive visualizations</li>"
-            "</ul>",
-        )
+        QMessageBox.about(self, "About Kenya Digital Farm Twin", _ABOUT_HTML)
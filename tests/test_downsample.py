@@ -0,0 +1,24 @@
+"""Tests for the plot downsampling helpers."""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+pytest.importorskip("PyQt5")
+
+from widgets.results.plots.base import downsample_index  # noqa: E402
+
+TARGET = 100
+
+
+@pytest.mark.parametrize("n", [TARGET + 1, 2 * TARGET - 1, 10 * TARGET + 7])
+def test_downsample_index_respects_target(n):
+    idx = downsample_index(n, TARGET)
+    # At most target strided points, plus the kept last point
+    assert len(idx) <= TARGET + 1
+    assert len(idx) < n
+    assert idx[0] == 0
+    assert idx[-1] == n - 1
+
+
+def test_downsample_index_keeps_short_series():
+    assert list(downsample_index(TARGET, TARGET)) == list(range(TARGET))